@@ -0,0 +1,8 @@
+"""Reproducible benchmarks for the engines, the frame building and the file import.
+
+Run "py -m benchmark" from the program folder. The results are written as JSON,
+so that two runs can be compared with "py -m benchmark -c [old file] [new file]".
+"""
+from benchmark.suite import run_suite, compare_results
+
+__all__ = ["run_suite", "compare_results"]
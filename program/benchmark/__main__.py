@@ -0,0 +1,41 @@
+"""Command line interface of the benchmark suite.
+
+Usage: py -m benchmark [-o results.json] [-e engine,engine] [-s size,size]
+       py -m benchmark -c [old results] [new results]
+"""
+import sys
+from time import strftime
+
+from benchmark.suite import SIZES, run_suite, compare_results
+from engines import ENGINES
+
+args = sys.argv[1:]
+
+if "-h" in args:
+    print(__doc__)
+    sys.exit(0)
+
+if "-c" in args:  # Compare
+    if len(args) != 3:
+        print("Usage: py -m benchmark -c [old results] [new results]")
+        sys.exit(1)
+    compare_results(args[1], args[2])
+    sys.exit(0)
+
+output = f"benchmark_{strftime('%Y%m%d_%H%M%S')}.json"
+engines = None
+sizes = SIZES
+
+if "-o" in args:  # Output file
+    output = args[args.index("-o") + 1]
+
+if "-e" in args:  # Engines
+    engines = args[args.index("-e") + 1].split(",")
+    if not all(engine in ENGINES for engine in engines):
+        print(f"Available engines are {', '.join(ENGINES)}.")
+        sys.exit(1)
+
+if "-s" in args:  # Sizes
+    sizes = tuple(int(size) for size in args[args.index("-s") + 1].split(","))
+
+run_suite(output, engines, sizes)
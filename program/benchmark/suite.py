@@ -0,0 +1,169 @@
+"""Benchmark cases and timing for the engines, the frame building and the file import."""
+import io
+import os
+import sys
+import json
+import platform
+from time import perf_counter, strftime
+from itertools import cycle
+from contextlib import redirect_stdout
+
+# main.py and engines.py live in the parent folder of this package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engines import ENGINES, NUMPY_ERR  # pylint: disable=wrong-import-position
+from renderer import DiffRenderer, build_frame  # pylint: disable=wrong-import-position
+from board_files import import_from_file  # pylint: disable=wrong-import-position
+from soups import generate_random_board  # pylint: disable=wrong-import-position
+
+# Boards shipped with the repository, user boards would make runs incomparable
+SHIPPED_BOARDS: tuple = ("101", "glider", "glider_gun")
+# Side lengths and densities of the random boards
+SIZES: tuple = (64, 256, 1024)
+DENSITIES: tuple = (0.1, 0.3, 0.5)
+# Seed for all random boards, so that every run benchmarks the same boards
+SEED: int = 2024
+# Every measurement runs for at least this many seconds, or MAX_RUNS times
+MIN_TIME: float = 0.5
+MAX_RUNS: int = 1000
+# The reference engine takes seconds per generation on big boards
+MAX_CELLS: dict = {"list": 256 * 256}
+
+
+def time_repeated(func) -> tuple[int, float]:
+    """Call func until at least MIN_TIME seconds have passed.
+
+    Return the number of calls and the total time in seconds.
+    """
+    runs, elapsed = 0, 0.0
+    start = perf_counter()
+    while elapsed < MIN_TIME and runs < MAX_RUNS:
+        func()
+        runs += 1
+        elapsed = perf_counter() - start
+    return runs, elapsed
+
+
+def make_result(kind: str, board_name: str, engine: str,
+                board: list[list[bool]], runs: int, elapsed: float) -> dict:
+    """Return one entry of the results file."""
+    return {"kind": kind, "board": board_name, "engine": engine,
+            "height": len(board), "width": len(board[0]),
+            "runs": runs, "seconds": elapsed, "per_second": runs / elapsed}
+
+
+def bench_engines(board_name: str, board: list[list[bool]], engines: list[str]) -> list[dict]:
+    """Measure the generations per second of every engine on one board."""
+    results: list[dict] = []
+    for name in engines:
+        if len(board) * len(board[0]) > MAX_CELLS.get(name, len(board) * len(board[0])):
+            continue
+
+        engine = ENGINES[name](board)
+        # Warm up worker processes and caches
+        engine.step()
+        runs, elapsed = time_repeated(engine.step)
+        engine.close()
+
+        results.append(make_result("step", board_name, name, board, runs, elapsed))
+        print(f"{board_name:>24} {name:>10}: {runs / elapsed:12.1f} generations/s")
+
+    return results
+
+
+def bench_frame(board_name: str, board: list[list[bool]]) -> list[dict]:
+    """Measure how many frames per second can be built for one board.
+
+    Complete frames are measured as well as the frames of the diff renderer,
+    which alternates between the board and its next generation.
+    """
+    runs, elapsed = time_repeated(lambda: build_frame(board, 1))
+    print(f"{board_name:>24} {'frame':>10}: {runs / elapsed:12.1f} frames/s")
+    results = [make_result("frame", board_name, "", board, runs, elapsed)]
+
+    engine = ENGINES["bits"](board)
+    engine.step()
+    renderer = DiffRenderer()
+    renderer.build(board, 0)
+    # Alternate between the two boards, so every frame has changes to draw
+    frames = cycle((engine.to_board(), board))
+    runs, elapsed = time_repeated(lambda: renderer.build(next(frames), 1))
+    print(f"{board_name:>24} {'diff':>10}: {runs / elapsed:12.1f} frames/s")
+    results.append(make_result("diff", board_name, "", board, runs, elapsed))
+
+    return results
+
+
+def bench_load(board_name: str) -> dict:
+    """Measure how many times per second a board file can be imported and read."""
+    def load() -> list[list[bool]]:
+        # Hide the success message of import_from_file()
+        with redirect_stdout(io.StringIO()):
+            return list(import_from_file(board_name))
+
+    board = load()
+    runs, elapsed = time_repeated(load)
+
+    print(f"{board_name:>24} {'load':>10}: {runs / elapsed:12.1f} loads/s")
+    return make_result("load", board_name, "", board, runs, elapsed)
+
+
+def run_suite(output: str, engines: list[str] | None = None, sizes: tuple = SIZES) -> dict:
+    """Run all benchmarks and write the results as JSON to the output file.
+
+    Return the results. All engines are benchmarked if none are specified,
+    except numpy if it isn't installed.
+    """
+    if engines is None:
+        engines = [name for name in ENGINES if name != "numpy" or not NUMPY_ERR]
+
+    results: list[dict] = []
+    for board_name in SHIPPED_BOARDS:
+        results.append(bench_load(board_name))
+        with redirect_stdout(io.StringIO()):
+            board = list(import_from_file(board_name))
+        results.extend(bench_frame(board_name, board))
+        results.extend(bench_engines(board_name, board, engines))
+
+    for size in sizes:
+        for density in DENSITIES:
+            # Same board for every run with the same size and density, also across Python
+            # processes, hash() of a tuple with a float isn't stable and can be negative
+            seed = SEED * 1_000_003 + size * 1_000 + round(density * 1000)
+            board = list(generate_random_board(size, size, density, seed))
+            board_name = f"random-{size}x{size}-{density}"
+
+            results.extend(bench_frame(board_name, board))
+            results.extend(bench_engines(board_name, board, engines))
+
+    report = {
+        "meta": {
+            "time": strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": SEED,
+            "min_time": MIN_TIME,
+        },
+        "results": results,
+    }
+    with open(output, "w", encoding="utf-8") as fp:
+        json.dump(report, fp, indent=2)
+
+    print(f"\nResults saved to {os.path.abspath(output)}")
+    return report
+
+
+def compare_results(old_path: str, new_path: str) -> None:
+    """Print the speed ratio of every measurement that is in both results files."""
+    with open(old_path, "r", encoding="utf-8") as fp:
+        old = {(r["kind"], r["board"], r["engine"]): r for r in json.load(fp)["results"]}
+    with open(new_path, "r", encoding="utf-8") as fp:
+        new = {(r["kind"], r["board"], r["engine"]): r for r in json.load(fp)["results"]}
+
+    print(f"{'kind':>6} {'board':>24} {'engine':>10} {'old/s':>12} {'new/s':>12} {'ratio':>7}")
+    for key, result in new.items():
+        if key not in old:
+            continue
+        ratio = result["per_second"] / old[key]["per_second"]
+        print(f"{key[0]:>6} {key[1]:>24} {key[2]:>10} {old[key]['per_second']:12.1f} "
+              f"{result['per_second']:12.1f} {ratio:6.2f}x")
@@ -1,16 +1,18 @@
-"""Separate module to specifically create boards, based on the main.py program."""
+"""Separate module to specifically create boards, based on the board_files.py module."""
 import sys
 import os
 
-# Prevent pyhon from creating pycache when importing main
+# Prevent pyhon from creating pycache when importing board_files
 sys.dont_write_bytecode = True
 try:
-    from main import (add_extension,
-                      manually_create_level,
-                      check_origin,
-                      BOARDS_PATH)
+    # Only the board handling, not the whole game of main.py
+    from board_files import (gol_filename,
+                             number_filename,
+                             manually_create_level,
+                             check_origin,
+                             BOARDS_PATH)
 except ImportError:
-    print("You didn't clone the GitHub repo properly or you deleted the main.py program.\n"
+    print("You didn't clone the GitHub repo properly or you deleted the board_files.py program.\n"
           "Please refer to the \"Installation\" section of the README for more Information.")
     sys.exit(1)
 
@@ -20,7 +22,7 @@ if len(sys.argv) != 2:
     print("Usage: py board_creator.py [filename]")
     sys.exit(1)
 
-filename = add_extension(sys.argv[1])
+filename = gol_filename(sys.argv[1])
 
 # Handle existing files
 origin = check_origin(filename)
@@ -39,6 +41,6 @@ if origin == BOARDS_PATH:
 
 else:  # origin = FAVOURITES_PATH
     print(f"A file called \"{filename}\" already exists in your favourites.")
-    filename = filename[:-4] + "(1)" + filename[-4:]  # Add (1) to name
+    filename = number_filename(filename)  # Add (1) to name
     print(f"A file called \"{filename}\" will be created instead.")
     manually_create_level(filename)
@@ -0,0 +1,215 @@
+"""Saved boards: where they are, how they are found, imported, exported and created.
+
+Importing this module has no side effects. The paths are relative to the
+program folder rather than the working directory, and the folders are only
+created once a board is written.
+"""
+import sys
+import os
+try:
+    # msvcrt is Windows-only
+    import msvcrt
+    MSVCRT_ERR = False
+except ImportError:
+    # Set error flag to true to avoid not running the program at all
+    MSVCRT_ERR = True
+
+from colorama import Fore
+
+from loaders import PATTERN_EXTENSIONS, PatternStream, open_pattern
+from catalog import BoardCatalog
+
+# Parent folder of the program folder
+ROOT_PATH: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Path to where the boards are stored
+BOARDS_PATH: str = os.path.join(ROOT_PATH, "boards")
+# Favourite boards
+FAVOURITES_PATH: str = os.path.join(ROOT_PATH, "favourites")
+
+# Names, sizes and hashes of the saved boards, outside of the boards folder so -e keeps it
+CATALOG = BoardCatalog(os.path.join(ROOT_PATH, ".board_catalog.json"),
+                       [BOARDS_PATH, FAVOURITES_PATH])
+
+
+def ensure_folders() -> None:
+    """Make the boards and favourites folders if they don't exist already."""
+    os.makedirs(BOARDS_PATH, exist_ok=True)
+    os.makedirs(FAVOURITES_PATH, exist_ok=True)
+
+
+def check_origin(filename: str) -> str:
+    """Check boards and favourites folder.
+
+    Return the location of the file, or None if it doesn't exist.
+    The folders are only listed again if their content changed, see catalog.py.
+    """
+    return CATALOG.locate(filename)
+
+
+def controlled_input(input_string: str, max_len: int) -> list[str]:
+    """Input function but with max length
+
+    Automatically returns and goes on to the next line when the specified
+    input length has been reached.
+    Still allows for Ctrl+C to interrupt the program.
+    This function was written with the help of ChatGPT.
+
+    WARNING: This only works on Windows devices.
+    """
+    input_chars: list[str] = []
+    print(input_string, end="", flush=True)
+
+    while True:
+        if msvcrt.kbhit():  # React to keyboard input
+            # Get typed character from keyboard and decode it
+            char = msvcrt.getwch()
+            # Handle all exceptions and special keys
+            if char == "\x03":  # Ctrl+C
+                # Simulate same behaviour of "regular" Ctrl+C
+                raise KeyboardInterrupt
+
+            if char == "\x08":  # Backspace key
+                if input_chars:
+                    input_chars.pop()
+                    # Move cursor back, overwrite character with a space
+                    print("\b \b", end="", flush=True)
+                continue
+
+            if char == "\r":  # Enter key
+                # Function returns automatically
+                continue
+
+            # Add typed character to list and print it to the screen
+            input_chars.append(char)
+            print(char, end="", flush=True)
+
+            if len(input_chars) >= max_len:
+                # Desired length reached
+                break
+
+    print()
+    return input_chars
+
+
+def import_from_file(filepath: str) -> PatternStream:
+    """Open a pattern file and return a stream of the rows of the board.
+
+    The engine builds the board from the stream directly, the cells are
+    checked while it reads them (raising FileInvalidError). Supported formats
+    are .gol, .rle, .cells, Life 1.06 (.lif, .life) and binary .golb checkpoints.
+    """
+    # Add file extension if it wasn't provided
+    filepath = add_extension(filepath)
+    # Raises TypeError if the file doesn't exist
+    path = os.path.join(check_origin(filepath), filepath)
+
+    print(f"{Fore.GREEN}SUCCESS: {Fore.RESET}File found, initializing...")
+
+    # Only reads the size, the cells are checked while the engine reads them
+    return open_pattern(path)
+
+
+def export_to_file(board: list[list[bool]], filename: str) -> None:
+    """Save a board as a .gol file in the boards folder.
+
+    Live cells are saved as "c" (counter), dead cells as spaces.
+    """
+    filename = gol_filename(filename)
+    ensure_folders()
+    with open(os.path.join(BOARDS_PATH, filename), "w", encoding="utf-8") as fp:
+        # Don't write last newline, like manually_create_level()
+        fp.write("\n".join("".join("c" if cell else " " for cell in row) for row in board))
+
+    print(f"{Fore.GREEN}SUCCESS: {Fore.RESET}Board saved as \"{filename}\".")
+
+
+def add_extension(filename: str) -> str:
+    """Add the extension to a pattern file if it doesn't have a supported one already.
+
+    If the pattern exists in another format than .gol (e.g. .rle), that
+    extension is added, otherwise .gol is added. Checkpoints (.golb) are
+    only used if there is no other file with the same name.
+    """
+    if filename.lower().endswith(PATTERN_EXTENSIONS):
+        return filename
+
+    for extension in PATTERN_EXTENSIONS:
+        if check_origin(filename + extension) is not None:
+            return filename + extension
+    return filename + ".gol"
+
+
+def gol_filename(filename: str) -> str:
+    """Return the name of the .gol file to write for a pattern name.
+
+    Boards created by the game are always saved in the .gol format.
+    """
+    return os.path.splitext(add_extension(filename))[0] + ".gol"
+
+
+def number_filename(filename: str) -> str:
+    """Add (1) to the end of a filename, keeping the extension."""
+    name, extension = os.path.splitext(filename)
+    return f"{name}(1){extension}"
+
+
+def manually_create_level(filename: str="") -> list[list[bool]]:
+    """Create a level according to user specifications.
+
+    The new level will be saved in a .gol file as characters.
+    Print a success message at the end if all worked well.
+    """
+    if MSVCRT_ERR:
+        # Invalid OS or python version
+        print(f"""
+{Fore.RED}FATAL ERROR{Fore.RESET}
+This part of the program cannot be accessed either due to an invalid Python version
+or not running the game on a Windows environment.
+
+Please restart the game either on a Windows device
+or using Python 3.12 or 3.11 (the game is tested for those versions).""")
+        sys.exit(1)
+
+    local_board: list[list[str]] = []
+    filename = gol_filename(filename)
+    ensure_folders()
+
+    with open(os.path.join(BOARDS_PATH, filename), "w", encoding="utf-8") as fp:
+        if check_origin(filename) == FAVOURITES_PATH:
+            print(f"A file called \"{filename}\" is already in your favourites.")
+            filename = number_filename(filename)  # Add ending (1) to filename
+            print(f"A file called \"{filename}\" will be created instead.")
+
+        print()
+        # Get parameters for the board from the user
+        while True:
+            width: str = input("Enter board width (cells): ")
+            if not width.isnumeric() or int(width) <= 1:
+                print("Minimum value is 2. Please only write numbers\n")
+                continue
+
+            height: str = input("Enter board height (cells): ")
+            if not height.isnumeric() or int(height) <= 1:
+                print("Minimum value is 2. Please only write numbers\n")
+                continue
+
+            height, width = int(height), int(width)
+            break
+
+        print()
+        # Actually get and save input
+        for i in range(height):
+            # Format and write chars entered by user
+            line: list[str] = controlled_input(f"Enter line No. {i + 1}: ", width)
+            # Directly convert input to bool values
+            processed_input = [not char == " " for char in line]
+            local_board.append(processed_input)
+
+            fp.write("".join(line))
+            if i != height - 1:
+                # Don't write last newline
+                fp.write("\n")
+
+        print(f"\n{Fore.GREEN}SUCCESS: {Fore.RESET}File created successfully!")
+
+    return local_board
@@ -0,0 +1,151 @@
+"""On-disk catalog of the saved boards.
+
+Looking up a board used to list the boards and the favourites folder every
+time, and listing the boards meant opening every file. The catalog keeps
+the names of the files in each folder together with the size, population
+and a hash of the cells of each board in a JSON file. A folder is only
+listed again if its modification time changed, which happens whenever a
+file is added, removed or renamed. A board is only read again if its own
+modification time or size changed.
+"""
+import os
+import json
+from time import time_ns
+from hashlib import blake2b
+
+from loaders import FileInvalidError, open_pattern
+
+# Timestamps newer than this (in ns) aren't trusted, a change in the same
+# tick of the file system clock wouldn't change them
+SETTLE_TIME: int = 2_000_000_000
+CATALOG_VERSION: int = 1
+
+
+def board_hash(path: str) -> dict:
+    """Read a board and return its size, population and a hash of its cells.
+
+    Boards with the same cells have the same hash, whatever their format is.
+    """
+    try:
+        pattern = open_pattern(path)
+        digest = blake2b(f"{pattern.height}x{pattern.width}".encode(), digest_size=16)
+        row_bytes = (pattern.width + 7) // 8
+        population = 0
+        for row in pattern.packed_rows():
+            digest.update(row.to_bytes(row_bytes, "little"))
+            population += row.bit_count()
+    except FileInvalidError as ex:
+        return {"error": ex.message}
+    except (OSError, UnicodeDecodeError):
+        return {"error": "The file can't be read."}
+
+    return {"height": pattern.height, "width": pattern.width,
+            "population": population, "hash": digest.hexdigest()}
+
+
+class BoardCatalog:
+    """Index of the board files in some folders, saved as JSON at the specified path.
+
+    The catalog is loaded on first use and saved whenever it changed.
+    """
+    def __init__(self, path: str, folders: list[str]):
+        self.path: str = path
+        self.folders: list[str] = folders
+        self.data: dict = {}
+        self.changed: bool = False
+
+    def _load(self) -> None:
+        """Load the catalog file, or start with an empty catalog."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") != CATALOG_VERSION:
+            data = {"version": CATALOG_VERSION, "folders": {}}
+        self.data = data
+
+    def save(self) -> None:
+        """Write the catalog to the disk if anything changed."""
+        if not self.changed:
+            return
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as fp:
+            json.dump(self.data, fp)
+        # Never leave a half written catalog behind
+        os.replace(temp_path, self.path)
+        self.changed = False
+
+    def _folder(self, folder: str) -> dict[str, dict]:
+        """Return the entries of the files in a folder, listing it only if it changed."""
+        if not self.data:
+            self._load()
+
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except FileNotFoundError:
+            # The user might have deleted the folder
+            return {}
+
+        cached = self.data["folders"].get(folder)
+        if cached is None or cached["mtime"] != mtime:
+            old_files = cached["files"] if cached else {}
+            # Keep the entries of files that are still there
+            files = {name: old_files.get(name, {}) for name in os.listdir(folder)}
+            # Folder changed too recently to be sure the time would change again
+            settled = time_ns() - mtime > SETTLE_TIME
+            cached = {"mtime": mtime if settled else None, "files": files}
+            self.data["folders"][folder] = cached
+            self.changed = True
+            self.save()
+
+        return cached["files"]
+
+    def locate(self, filename: str) -> str | None:
+        """Return the folder that contains the file, or None if it isn't in any of them."""
+        for folder in self.folders:
+            if filename in self._folder(folder):
+                return folder
+        return None
+
+    def names(self, folder: str) -> list[str]:
+        """Return the sorted names of the files in a folder."""
+        return sorted(self._folder(folder))
+
+    def info(self, filename: str, folder: str) -> dict | None:
+        """Return the size, population and hash of a board, reading it only if it changed.
+
+        Invalid boards have an "error" entry instead. Returns None if the file
+        is gone, e.g. deleted after the folder was listed.
+        """
+        files = self._folder(folder)
+        path = os.path.join(folder, filename)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            if files.pop(filename, None) is not None:
+                self.changed = True
+            return None
+        entry = files.get(filename, {})
+
+        if entry.get("mtime") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+            entry = board_hash(path)
+            # Boards changed in the last moments are read again next time
+            settled = time_ns() - stat.st_mtime_ns > SETTLE_TIME
+            entry.update(mtime=stat.st_mtime_ns if settled else None, size=stat.st_size)
+            files[filename] = entry
+            self.changed = True
+
+        return entry
+
+    def duplicates(self) -> list[list[str]]:
+        """Return groups of boards with the same cells, in all folders."""
+        by_hash: dict[str, list[str]] = {}
+        for folder in self.folders:
+            for filename in self.names(folder):
+                entry = self.info(filename, folder)
+                digest = entry.get("hash") if entry else None
+                if digest:
+                    by_hash.setdefault(digest, []).append(filename)
+        self.save()
+        return [names for names in by_hash.values() if len(names) > 1]
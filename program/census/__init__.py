@@ -0,0 +1,9 @@
+"""Census of random soups, how long they live and how they end.
+
+Run "py -m census" from the program folder. Every soup is a seeded random
+board, so each result can be reproduced. The results are appended to a
+JSON lines file, running the census again skips the seeds that are already in it.
+"""
+from census.runner import run_census, run_soup, summarize
+
+__all__ = ["run_census", "run_soup", "summarize"]
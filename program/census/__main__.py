@@ -0,0 +1,63 @@
+"""Command line interface of the soup census.
+
+Usage: py -m census [-n soups] [-f first seed] [-s size] [-d density] [-m engine]
+                    [-r rule] [-g max generations] [-p processes] [-o results.jsonl]
+       py -m census -c [results.jsonl]
+"""
+import sys
+
+from census.runner import (DENSITY, MAX_GENERATIONS, SIZE, SOUPS, CensusSettings,
+                           run_census, summarize)
+from engines import ENGINES
+from rules import Rule
+
+args = sys.argv[1:]
+
+if "-h" in args:
+    print(__doc__)
+    sys.exit(0)
+
+if "-c" in args:  # Count the results of a file
+    if len(args) != 2:
+        print("Usage: py -m census -c [results.jsonl]")
+        sys.exit(1)
+    summarize(args[1])
+    sys.exit(0)
+
+
+def value(flag: str, default: str) -> str:
+    """Return the argument after a flag, or the default if the flag isn't there."""
+    return args[args.index(flag) + 1] if flag in args else default
+
+
+try:
+    soups = int(value("-n", str(SOUPS)))
+    first = int(value("-f", "0"))
+    size = int(value("-s", str(SIZE)))
+    density = float(value("-d", str(DENSITY)))
+    max_generations = int(value("-g", str(MAX_GENERATIONS)))
+    processes = int(value("-p", "0"))
+except (ValueError, IndexError):
+    print("-n, -f, -s, -g and -p need whole numbers, -d a number between 0 and 1.")
+    sys.exit(1)
+
+if size < 2 or not 0 <= density <= 1 or soups < 1 or max_generations < 1 or processes < 0:
+    print("Soups need a size of at least 2 and a density between 0 and 1.")
+    sys.exit(1)
+
+engine = value("-m", "bits")
+# The parallel engine can't start its own processes inside the census pool
+engines = [name for name in ENGINES if name != "parallel"]
+if engine not in engines:
+    print(f"Available engines are {', '.join(engines)}.")
+    sys.exit(1)
+
+try:
+    rule = Rule(value("-r", "B3/S23")).name
+except ValueError as ex:
+    print(ex)
+    sys.exit(1)
+
+settings = CensusSettings(size, density, engine, rule, max_generations)
+output = value("-o", f"census_{size}x{size}_{density}_{rule.replace('/', '')}.jsonl")
+run_census(output, settings, range(first, first + soups), processes)
@@ -0,0 +1,161 @@
+"""Running seeded random soups on a process pool and collecting how they end."""
+import os
+import sys
+import json
+import multiprocessing
+from collections import Counter
+from time import perf_counter
+from typing import Iterable, NamedTuple
+
+# main.py and engines.py live in the parent folder of this package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engines import ENGINES  # pylint: disable=wrong-import-position
+from cycles import CycleDetector  # pylint: disable=wrong-import-position
+from objects import find_objects  # pylint: disable=wrong-import-position
+from rules import CONWAY, Rule  # pylint: disable=wrong-import-position
+from soups import generate_random_board  # pylint: disable=wrong-import-position
+
+# Defaults of the command line
+SOUPS: int = 1000
+SIZE: int = 64
+DENSITY: float = 0.5
+MAX_GENERATIONS: int = 10_000
+# Soups handed to a worker process at once, small enough to keep all cores busy until the end
+CHUNK_SIZE: int = 4
+# Most common objects shown in the summary
+OBJECTS_SHOWN: int = 15
+
+
+class CensusSettings(NamedTuple):
+    """Parameters shared by all soups of a census, results only count for the same settings."""
+    size: int
+    density: float
+    engine: str
+    rule: str
+    max_generations: int
+
+
+def run_soup(seed: int, settings: CensusSettings) -> dict:
+    """Run one soup until it dies out, only consists of still lives, oscillates or hits the limit.
+
+    Return the entry of the results file. The lifetime is the first
+    generation of the final state, e.g. the generation the cycle was entered.
+    The objects left on the final board are only counted for Conway's rules.
+    """
+    # The same seed always gives the same soup, the rows are streamed into the engine
+    board = generate_random_board(settings.size, settings.size, settings.density, seed)
+    engine = ENGINES[settings.engine](board, Rule(settings.rule))
+    detector = CycleDetector()
+    detector.check(engine.fingerprint(), 0)
+
+    outcome, lifetime, period = "limit", settings.max_generations, 0
+    for generation in range(1, settings.max_generations + 1):
+        if not engine.step():
+            outcome, lifetime, period = "still", generation - 1, 1
+            break
+        if engine.population() == 0:
+            outcome, lifetime = "died", generation
+            break
+        if detector.check(engine.fingerprint(), generation):
+            outcome, lifetime, period = "cycle", detector.start, detector.period
+            break
+
+    population = engine.population()
+    objects = find_objects(engine.packed_rows()) if engine.rule == CONWAY else {}
+    engine.close()
+    return {"seed": seed, **settings._asdict(), "outcome": outcome,
+            "lifetime": lifetime, "period": period, "population": population,
+            "objects": dict(objects)}
+
+
+def _run_soup(task: tuple[int, CensusSettings]) -> dict:
+    """Unpack the task of a worker process."""
+    return run_soup(*task)
+
+
+def finished_seeds(path: str, settings: CensusSettings) -> set[int]:
+    """Return the seeds that already have a result with the same settings in the results file."""
+    seeds: set[int] = set()
+    try:
+        with open(path, "r", encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Last line of an interrupted run might be cut off
+                    continue
+                if all(entry.get(key) == value for key, value in settings._asdict().items()):
+                    seeds.add(entry["seed"])
+    except FileNotFoundError:
+        pass
+    return seeds
+
+
+def run_census(output: str, settings: CensusSettings, seeds: Iterable[int],
+               processes: int = 0) -> None:
+    """Run the soups of all seeds that aren't in the results file yet, on a pool of processes.
+
+    Every result is appended to the file as soon as it's finished, so an
+    interrupted census continues where it stopped. Default is one process
+    per CPU core.
+    """
+    output = os.path.abspath(output)
+    done = finished_seeds(output, settings)
+    todo = [seed for seed in seeds if seed not in done]
+    if done:
+        print(f"Skipping {len(done)} soups that are already in {output}")
+    if not todo:
+        summarize(output)
+        return
+
+    processes = processes or os.cpu_count() or 1
+    print(f"Running {len(todo)} soups of {settings.size}x{settings.size} cells "
+          f"(density {settings.density}, {settings.rule}) on {processes} processes...")
+
+    start_time = perf_counter()
+    finished = 0
+    with open(output, "a", encoding="utf-8") as fp, multiprocessing.Pool(processes) as pool:
+        try:
+            # Results come back in the order they finish, every soup is independent
+            for entry in pool.imap_unordered(_run_soup, ((seed, settings) for seed in todo),
+                                             CHUNK_SIZE):
+                fp.write(json.dumps(entry) + "\n")
+                fp.flush()
+                finished += 1
+                if finished % 100 == 0 or finished == len(todo):
+                    elapsed = perf_counter() - start_time
+                    print(f"{finished}/{len(todo)} soups, {finished / elapsed:.1f} soups/s")
+        except KeyboardInterrupt:
+            pool.terminate()
+            print(f"\nInterrupted after {finished} soups, run the same command again to continue.")
+            return
+
+    summarize(output)
+
+
+def summarize(path: str) -> None:
+    """Print how the soups of a results file ended, how long they lived and what was left."""
+    by_outcome: dict[str, list[dict]] = {}
+    objects: Counter[str] = Counter()
+    with open(path, "r", encoding="utf-8") as fp:
+        for line in fp:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            by_outcome.setdefault(entry["outcome"], []).append(entry)
+            objects.update(entry["objects"])
+
+    total = sum(len(entries) for entries in by_outcome.values())
+    print(f"\n{total} soups in {path}")
+    print(f"{'outcome':>8} {'soups':>7} {'share':>7} {'lifetime':>9} {'longest':>8} {'population':>11}")
+    for outcome, entries in sorted(by_outcome.items()):
+        lifetimes = [entry["lifetime"] for entry in entries]
+        population = sum(entry["population"] for entry in entries) / len(entries)
+        print(f"{outcome:>8} {len(entries):7} {len(entries) / total:7.1%} "
+              f"{sum(lifetimes) / len(entries):9.1f} {max(lifetimes):8} {population:11.1f}")
+
+    if objects:
+        print(f"\n{'object':>24} {'count':>9} {'per soup':>9}")
+        for name, count in objects.most_common(OBJECTS_SHOWN):
+            print(f"{name:>24} {count:9} {count / total:9.2f}")
@@ -0,0 +1,43 @@
+"""Detection of oscillating boards using fingerprints of past generations."""
+from collections import deque
+
+
+class CycleDetector:
+    """Remember the fingerprints of the latest generations to detect repeating boards.
+
+    Only the fingerprints are stored, never the boards themselves. Periods
+    longer than max_history generations can't be detected.
+    """
+    def __init__(self, max_history: int = 1000):
+        self.max_history: int = max_history
+        # Fingerprint -> generation it was last seen in
+        self.seen: dict[int, int] = {}
+        self.order: deque = deque()
+        self.period: int = 0  # 0 as long as no cycle was found
+        self.start: int = 0  # Generation where the cycle was entered
+
+    def reset(self) -> None:
+        """Forget all generations, e.g. after jumping ahead."""
+        self.seen.clear()
+        self.order.clear()
+        self.period = self.start = 0
+
+    def check(self, fingerprint: int, generation: int) -> bool:
+        """Record the fingerprint of a generation. Return whether the board entered a cycle."""
+        if fingerprint in self.seen:
+            self.start = self.seen[fingerprint]
+            self.period = generation - self.start
+            return True
+
+        self.seen[fingerprint] = generation
+        self.order.append(fingerprint)
+        if len(self.order) > self.max_history:
+            # Forget the oldest generation
+            del self.seen[self.order.popleft()]
+        return False
+
+    def describe(self) -> str:
+        """Return a short description of the cycle, or an empty string if there is none."""
+        if not self.period:
+            return ""
+        return f"The board entered a period-{self.period} cycle at generation {self.start}."
@@ -0,0 +1,1225 @@
+"""Board representations and stepping engines for the Game of Life.
+
+Every engine is created from the list[list[bool]] board used by main.py
+and can convert back to it whenever a frame has to be drawn.
+"""
+import os
+import sys
+import atexit
+import importlib.util
+from array import array
+from collections import Counter
+from typing import Iterator
+
+from loaders import PatternStream, pack_row, unpack_row
+from rules import CONWAY, Rule
+from stats import RowStats, bounding_box
+
+# NumPy is optional and takes a while to import, only the numpy engine imports it
+NUMPY_ERR: bool = importlib.util.find_spec("numpy") is None
+np = None  # The numpy module once a numpy engine was created
+
+
+def count_neighbors(board: list[list[bool]], row: int, col: int) -> int:
+    """Count the number of live neighbors for a given cell.
+
+    Iterate over relative positions of neighbour cells
+    and check the state of the counters inside.
+    """
+    # Relative position of the cells neighbours
+    neighbour_rel_pos: list = [(row - 1, col - 1), (row - 1, col), (row - 1, col + 1),
+                               (row, col - 1),                     (row, col + 1),
+                               (row + 1, col - 1), (row + 1, col), (row + 1, col + 1),]
+
+    live_neighbors: int = 0
+    for i, j in neighbour_rel_pos:
+        #           counter is in a valid position          cell is alive
+        if (0 <= i < len(board) and 0 <= j < len(board[0])) and board[i][j]:
+            live_neighbors += 1
+
+    return live_neighbors
+
+
+def next_generation(board: list[list[bool]], rule: Rule = CONWAY,
+                    changed: list[int] | None = None) -> list[list[bool]]:
+    """Return the next generation of a board according to the rule, Conway's by default.
+
+    Cells outside of the board are always dead. The indices of the rows
+    with a changed cell are appended to changed if it's given.
+    """
+    # Initialize a board where all cells are dead
+    new_board: list[list[bool]] = [[False] * len(board[0]) for _ in range(len(board))]
+
+    for i, _ in enumerate(board):
+        for j, counter in enumerate(board[i]):
+            live_neighbors = count_neighbors(board, i, j)
+
+            # Apply the rule, looked up by the state of the cell and its neighbour count
+            new_board[i][j] = alive = rule.table[9 * counter + live_neighbors]
+            if changed is not None and alive != counter and changed[-1:] != [i]:
+                changed.append(i)
+
+    return new_board
+
+
+def packed_rows(board: list[list[bool]] | PatternStream) -> Iterator[int]:
+    """Iterate over the rows of a board packed with pack_row().
+
+    Binary pattern files are already packed and skip the list[bool] rows.
+    """
+    if isinstance(board, PatternStream):
+        return board.packed_rows()
+    return (pack_row(row) for row in board)
+
+
+def unpack_window(rows: list[int], left: int, width: int) -> list[list[bool]]:
+    """Unpack the columns left to left + width of some rows packed with pack_row()."""
+    mask = (1 << width) - 1
+    return [unpack_row(row >> left & mask, width) for row in rows]
+
+
+class Engine:
+    """Base class for all stepping engines.
+
+    An engine owns the board in its own representation. The main loop
+    only calls step() and converts back with to_board() to draw a frame.
+    Engines can also be created from a PatternStream, they only iterate
+    over its rows once, so no list[list[bool]] board is built in between.
+    All engines follow the lookup table of a rule, Conway's rule by default.
+    """
+    # Unbounded engines simulate an endless world, the board is only a window into it
+    unbounded: bool = False
+
+    def __init__(self, board: list[list[bool]] | PatternStream, rule: Rule = CONWAY):
+        self.rule: Rule = rule
+        self.height: int = len(board)
+        # Pattern streams know their width without reading a row
+        self.width: int = board.width if isinstance(board, PatternStream) else len(board[0])
+        # Engines with bit-packed rows keep their statistics here, see stats.py
+        self.stats: RowStats | None = None
+
+    def step(self) -> bool:
+        """Advance the board by one generation. Return whether any cell changed."""
+        raise NotImplementedError
+
+    def population(self) -> int:
+        """Return the number of live cells on the board."""
+        raise NotImplementedError
+
+    def to_board(self) -> list[list[bool]]:
+        """Return the board in the list[list[bool]] form the renderer expects.
+
+        The returned board must not be changed by later steps, the renderer
+        compares it with the next one.
+        """
+        raise NotImplementedError
+
+    def fingerprint(self) -> int:
+        """Return a cheap hash of the board, equal boards have equal fingerprints."""
+        return hash(tuple(tuple(row) for row in self.to_board()))
+
+    def packed_rows(self) -> list[int]:
+        """Return the rows of the board packed with pack_row(), e.g. to save a checkpoint."""
+        return [pack_row(row) for row in self.to_board()]
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        """Return the first and last row and column with live cells, or None if the board is empty.
+
+        Unbounded engines return the box of all live cells in board coordinates,
+        it can reach beyond the board.
+        """
+        return bounding_box(self.packed_rows())
+
+    def region_rows(self, top: int, left: int, height: int, width: int) -> list[int]:
+        """Return the rows of a part of the board packed with pack_row(), column left is bit 0.
+
+        Unbounded engines can also return parts outside of the board, e.g. the bounding box.
+        """
+        mask = (1 << width) - 1
+        return [row >> left & mask for row in self.packed_rows()[top:top + height]]
+
+    def window(self, top: int, left: int, height: int, width: int) -> list[list[bool]]:
+        """Return a part of the board, e.g. the part that is visible in the viewport.
+
+        The window must lie within the board. Engines that have to build the
+        whole board in to_board() only convert the cells inside the window.
+        """
+        return [row[left:left + width] for row in self.to_board()[top:top + height]]
+
+    def advance(self, generations: int) -> None:
+        """Advance the board by the specified amount of generations.
+
+        Stops early once the board doesn't change anymore, as all following
+        generations would be the same.
+        """
+        for _ in range(generations):
+            if not self.step():
+                break
+
+    def info(self) -> str:
+        """Return engine specific statistics, or an empty string if there are none."""
+        return ""
+
+    def close(self) -> None:
+        """Release resources like worker processes. The engine can't be used afterwards."""
+
+
+class ListEngine(Engine):
+    """Reference engine, checks every cell with count_neighbors().
+
+    The rows are also kept bit-packed for the statistics, only the rows
+    that changed are packed again.
+    """
+    def __init__(self, board: list[list[bool]], rule: Rule = CONWAY):
+        super().__init__(board, rule)
+        self.board: list[list[bool]] = [list(row) for row in board]
+        self.stats = RowStats([pack_row(row) for row in self.board], self.width)
+
+    def step(self) -> bool:
+        changed: list[int] = []
+        self.board = next_generation(self.board, self.rule, changed)
+        return self.stats.update(changed, [pack_row(self.board[i]) for i in changed])
+
+    def population(self) -> int:
+        return self.stats.population
+
+    def fingerprint(self) -> int:
+        return self.stats.hash
+
+    def packed_rows(self) -> list[int]:
+        return list(self.stats.rows)
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        return self.stats.bounding_box()
+
+    def to_board(self) -> list[list[bool]]:
+        return self.board
+
+
+class TileEngine(Engine):
+    """Engine that only recomputes the tiles of the board that can change.
+
+    The board is split into square tiles. A cell can only change if a cell in
+    its own tile or a neighbouring tile changed in the last generation, so
+    all other tiles are copied forward untouched. Boards that settled into
+    still lives are therefore a lot cheaper than with the list engine.
+    """
+    def __init__(self, board: list[list[bool]], rule: Rule = CONWAY, tile_size: int = 8):
+        super().__init__(board, rule)
+        self.board: list[list[bool]] = [list(row) for row in board]
+        self.tile_size: int = tile_size
+        self.tile_rows: int = -(-self.height // tile_size)  # Ceiling division
+        self.tile_cols: int = -(-self.width // tile_size)
+        # Every tile has to be computed in the first generation
+        self.active: set[tuple[int, int]] = {(ti, tj) for ti in range(self.tile_rows)
+                                             for tj in range(self.tile_cols)}
+        self.stats = RowStats([pack_row(row) for row in self.board], self.width)
+        # Statistics for info()
+        self.active_tiles: int = 0
+        self.total_active: int = 0
+        self.generations: int = 0
+
+    def step(self) -> bool:
+        board, size = self.board, self.tile_size
+        height, width = self.height, self.width
+        table = self.rule.table
+        # Rows of stable tiles are shared with the old board, they don't change
+        new_board = list(board)
+        copied_rows: set[int] = set()
+        changed: set[int] = set()  # Rows with a cell that changed
+        next_active: set[tuple[int, int]] = set()
+
+        for ti, tj in self.active:
+            first_row, first_col = ti * size, tj * size
+            last_col = min(first_col + size, width)
+            tile_changed = False
+
+            for i in range(first_row, min(first_row + size, height)):
+                if i not in copied_rows:
+                    # Copy the row before changing it, the old board must stay intact
+                    new_board[i] = list(board[i])
+                    copied_rows.add(i)
+                row, new_row = board[i], new_board[i]
+                above = board[i - 1] if i > 0 else None
+                below = board[i + 1] if i < height - 1 else None
+
+                for j in range(first_col, last_col):
+                    # Slices end at the edge of the board by themselves
+                    start = j - 1 if j > 0 else 0
+                    counter = row[j]
+                    live_neighbors = sum(row[start:j + 2]) - counter
+                    if above is not None:
+                        live_neighbors += sum(above[start:j + 2])
+                    if below is not None:
+                        live_neighbors += sum(below[start:j + 2])
+
+                    alive = table[9 * counter + live_neighbors]
+                    if alive != counter:
+                        new_row[j] = alive
+                        changed.add(i)
+                        tile_changed = True
+
+            if tile_changed:
+                # Cells of this tile and all neighbouring tiles can change next generation
+                next_active.update((ti + di, tj + dj) for di in (-1, 0, 1) for dj in (-1, 0, 1)
+                                   if 0 <= ti + di < self.tile_rows and 0 <= tj + dj < self.tile_cols)
+
+        self.active_tiles = len(self.active)
+        self.total_active += self.active_tiles
+        self.generations += 1
+
+        self.board = new_board
+        self.active = next_active
+        dirty = sorted(changed)
+        return self.stats.update(dirty, [pack_row(new_board[i]) for i in dirty])
+
+    def population(self) -> int:
+        return self.stats.population
+
+    def fingerprint(self) -> int:
+        return self.stats.hash
+
+    def packed_rows(self) -> list[int]:
+        return list(self.stats.rows)
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        return self.stats.bounding_box()
+
+    def to_board(self) -> list[list[bool]]:
+        return self.board
+
+    def info(self) -> str:
+        average = self.total_active / self.generations if self.generations else 0
+        return (f"Active tiles: {self.active_tiles} of {self.tile_rows * self.tile_cols} "
+                f"in the last generation, {average:.1f} on average")
+
+
+class NumpyEngine(Engine):
+    """Array-backed engine, computes a whole generation with shifted-array neighbour sums.
+
+    The board is padded with a ring of dead cells before shifting, so the
+    result is the same as with the dead border of count_neighbors().
+    """
+    def __init__(self, board: list[list[bool]], rule: Rule = CONWAY):
+        global np  # pylint: disable=global-statement
+        import numpy as np  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        super().__init__(board, rule)
+        self.cells = np.zeros((self.height, self.width), dtype=np.uint8)
+        # Lookup table of the rule, indexed by 9 * state + live neighbours
+        self.table = np.array(rule.table, dtype=np.uint8)
+        for i, row in enumerate(board):
+            self.cells[i] = row
+
+    def step(self) -> bool:
+        padded = np.pad(self.cells, 1)
+        # Sum up the 8 shifted copies of the board
+        neighbours = (padded[:-2, :-2] + padded[:-2, 1:-1] + padded[:-2, 2:]
+                      + padded[1:-1, :-2]                  + padded[1:-1, 2:]
+                      + padded[2:, :-2] + padded[2:, 1:-1] + padded[2:, 2:])
+
+        # Look up the next state of every cell at once
+        new_cells = self.table[9 * self.cells + neighbours]
+        changed = not np.array_equal(new_cells, self.cells)
+        self.cells = new_cells
+        return changed
+
+    def population(self) -> int:
+        return int(self.cells.sum())
+
+    def fingerprint(self) -> int:
+        return hash(self.cells.tobytes())
+
+    def to_board(self) -> list[list[bool]]:
+        return self.cells.astype(bool).tolist()
+
+    def window(self, top: int, left: int, height: int, width: int) -> list[list[bool]]:
+        return self.cells[top:top + height, left:left + width].astype(bool).tolist()
+
+    def packed_rows(self) -> list[int]:
+        # Lowest bit first, the same order as pack_row()
+        packed = np.packbits(self.cells, axis=1, bitorder="little")
+        return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+
+class BitEngine(Engine):
+    """Bit-packed engine, stores every row as a Python int used as a bitset.
+
+    Bit j of a row is the cell in column j. A whole row advances with a few
+    big-int operations by adding up the 8 shifted neighbour rows bit by bit,
+    see rules.compile_step_row().
+    Doesn't need any modules outside of the standard library.
+    """
+    def __init__(self, board: list[list[bool]], rule: Rule = CONWAY):
+        super().__init__(board, rule)
+        self.mask: int = (1 << self.width) - 1
+        self.rows: list[int] = list(packed_rows(board))
+        # Population and hash are only updated for the rows that changed, the stats change the rows in place
+        self.stats = RowStats(self.rows, self.width)
+
+    def step(self) -> bool:
+        mask = self.mask
+        rows = self.rows
+        step_row = self.rule.step_row
+        candidates = self.stats.candidates()
+        if candidates is None:
+            # Dead rows above and below the board
+            padded = [0, *rows, 0]
+            new_rows = [step_row(padded[i], row, padded[i + 2], mask) for i, row in enumerate(rows)]
+            return self.stats.replace(new_rows)
+
+        # Only rows next to a row that changed in the last step can change
+        last = self.height - 1
+        dirty, new = [], []
+        for i in candidates:
+            row = step_row(rows[i - 1] if i else 0, rows[i], rows[i + 1] if i < last else 0, mask)
+            if row != rows[i]:
+                dirty.append(i)
+                new.append(row)
+        return self.stats.update(dirty, new)
+
+    def population(self) -> int:
+        return self.stats.population
+
+    def fingerprint(self) -> int:
+        return self.stats.hash
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        return self.stats.bounding_box()
+
+    def to_board(self) -> list[list[bool]]:
+        return [unpack_row(row, self.width) for row in self.rows]
+
+    def window(self, top: int, left: int, height: int, width: int) -> list[list[bool]]:
+        return unpack_window(self.rows[top:top + height], left, width)
+
+    def packed_rows(self) -> list[int]:
+        return list(self.rows)
+
+
+# Cache folder of the block lookup tables, next to the boards folder
+TABLE_FOLDER: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".cache")
+# Loaded on first use by block_table(), so other engines never pay for them
+_block_tables: dict[Rule, bytes] = {}
+# Low and high nibble of every byte
+LOW_NIBBLES: bytes = bytes(byte & 15 for byte in range(256))
+HIGH_NIBBLES: bytes = bytes(byte >> 4 for byte in range(256))
+# Top and bottom row of the results of two neighbouring blocks in one byte, the left one in the low nibble
+TOP_HALVES: bytes = bytes((byte & 3) | (byte >> 4 & 3) << 2 for byte in range(256))
+BOTTOM_HALVES: bytes = bytes((byte >> 2 & 3) | (byte >> 6) << 2 for byte in range(256))
+
+
+def build_block_table(rule: Rule = CONWAY) -> bytes:
+    """Return the next generation of the 2x2 centre of every possible 4x4 block.
+
+    Bit 4 * r + c of the index is the cell in row r and column c of the block.
+    Bits 0 and 1 of the result are the top row of the centre, bits 2 and 3 the bottom row.
+    """
+    table = bytearray(1 << 16)
+    for block in range(1 << 16):
+        result = 0
+        for bit, (r, c) in enumerate(((1, 1), (1, 2), (2, 1), (2, 2))):
+            live_neighbors = sum(block >> (4 * (r + dr) + c + dc) & 1
+                                 for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                                 if dr or dc)
+            alive = block >> (4 * r + c) & 1
+            if rule.table[9 * alive + live_neighbors]:
+                result |= 1 << bit
+        table[block] = result
+    return bytes(table)
+
+
+def block_table(rule: Rule = CONWAY) -> bytes:
+    """Return the block lookup table of a rule, loading it from the disk or building it on first use."""
+    if rule in _block_tables:
+        return _block_tables[rule]
+
+    # One file per rule, e.g. block_table_B3_S23.bin
+    path = os.path.join(TABLE_FOLDER, f"block_table_{rule.name.replace('/', '_')}.bin")
+    table = b""
+    try:
+        with open(path, "rb") as fp:
+            table = fp.read()
+    except OSError:
+        pass
+
+    if len(table) != 1 << 16:
+        # Missing or damaged, building it takes a moment
+        table = build_block_table(rule)
+        os.makedirs(TABLE_FOLDER, exist_ok=True)
+        with open(path, "wb") as fp:
+            fp.write(table)
+    _block_tables[rule] = table
+    return table
+
+
+class LookupEngine(Engine):
+    """Lookup table engine, advances 2x2 blocks of cells with a single table lookup.
+
+    The next generation of the centre of a 4x4 block only depends on the
+    16 cells of the block, so all 65536 outcomes are computed once and
+    cached on the disk (see block_table()). The rows are bit-packed like
+    in the bits engine.
+    The 4 cells of every block of a row are spread into 16 bit lanes with
+    bytes.translate(), so the 4 rows of the blocks can be merged into table
+    indices with a few big-int operations and looked up with map(), without
+    a Python loop over the blocks. Only the rows next to the rows that
+    changed are computed, like in the bits engine. It's still slower than
+    the bits engine, it's kept as an experiment.
+    """
+    def __init__(self, board: list[list[bool]], rule: Rule = CONWAY):
+        super().__init__(board, rule)
+        self.mask: int = (1 << self.width) - 1
+        self.rows: list[int] = list(packed_rows(board))
+        self.stats = RowStats(self.rows, self.width)
+        self.table: bytes = block_table(rule)
+        # Bytes of a row with room for the column left and right of the board
+        self.row_bytes: int = (self.width >> 3) + 2
+
+    def _lanes(self, row: int) -> tuple[int, int]:
+        """Return the blocks of a row with 16 bit per block, for the blocks at columns 4m - 1 and 4m + 1.
+
+        Lane m holds the 4 cells of block m in its lowest bits.
+        """
+        size = self.row_bytes
+        lanes: list[int] = []
+        # Column -1 is bit 0 for the first blocks, column 1 for the others
+        for shifted in (row << 1, row >> 1):
+            data = shifted.to_bytes(size, "little")
+            spread = bytearray(4 * size)
+            # Nibble m of the row goes to byte 2m
+            spread[0::4] = data.translate(LOW_NIBBLES)
+            spread[2::4] = data.translate(HIGH_NIBBLES)
+            lanes.append(int.from_bytes(spread, "little"))
+        return lanes[0], lanes[1]
+
+    def step(self) -> bool:
+        table, size, mask, height = self.table, self.row_bytes, self.mask, self.height
+        rows = self.rows
+        candidates = self.stats.candidates()
+        # Pairs of rows that are computed together, only the ones next to a changed row can change
+        pairs = range(0, height, 2) if candidates is None else sorted({i & ~1 for i in candidates})
+        # Every row is part of the blocks of two pairs
+        lanes: dict[int, tuple[int, int]] = {}
+        empty = (0, 0)
+        new_rows = list(rows)
+
+        for i in pairs:
+            block_rows = range(i - 1, i + 3)
+            if not any(rows[k] for k in block_rows if 0 <= k < height):
+                # Dead cells stay dead around empty rows
+                new_rows[i:i + 2] = [0] * len(new_rows[i:i + 2])
+                continue
+            for k in block_rows:
+                if k not in lanes:
+                    lanes[k] = self._lanes(rows[k]) if 0 <= k < height else empty
+            l0, l1, l2, l3 = (lanes[k] for k in block_rows)
+
+            results: list[int] = []
+            for half in (0, 1):
+                # Table index of every block, the 4 rows of the block next to each other
+                indices = array("H", (l0[half] | l1[half] << 4 | l2[half] << 8 | l3[half] << 12)
+                                .to_bytes(4 * size, "little"))
+                if sys.byteorder == "big":
+                    indices.byteswap()
+                results.append(int.from_bytes(bytes(map(table.__getitem__, indices)), "little"))
+
+            # Byte m holds the results of the blocks at columns 4m - 1 and 4m + 1
+            merged = (results[0] | results[1] << 4).to_bytes(2 * size, "little")
+            top, bottom = merged.translate(TOP_HALVES), merged.translate(BOTTOM_HALVES)
+            new_rows[i] = (int.from_bytes(top[0::2], "little")
+                           | int.from_bytes(top[1::2], "little") << 4) & mask
+            if i + 1 < height:
+                new_rows[i + 1] = (int.from_bytes(bottom[0::2], "little")
+                                   | int.from_bytes(bottom[1::2], "little") << 4) & mask
+
+        return self.stats.replace(new_rows)
+
+    def population(self) -> int:
+        return self.stats.population
+
+    def fingerprint(self) -> int:
+        return self.stats.hash
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        return self.stats.bounding_box()
+
+    def to_board(self) -> list[list[bool]]:
+        return [unpack_row(row, self.width) for row in self.rows]
+
+    def window(self, top: int, left: int, height: int, width: int) -> list[list[bool]]:
+        return unpack_window(self.rows[top:top + height], left, width)
+
+    def packed_rows(self) -> list[int]:
+        return list(self.rows)
+
+
+# State of a worker process of the parallel engine, set up by _init_worker()
+_worker: dict = {}
+
+
+def _init_worker(buffer, height: int, width: int, rule: str) -> None:
+    """Attach a worker process to the shared board buffer of a ParallelEngine.
+
+    The rule is passed by name, its step function can't be sent to another process.
+    """
+    _worker["step_row"] = Rule(rule).step_row
+    _worker["buffer"] = memoryview(buffer).cast("B")
+    _worker["height"], _worker["width"] = height, width
+    _worker["row_bytes"] = (width + 7) // 8
+    _worker["mask"] = (1 << width) - 1
+
+
+def _step_stripe(task: tuple[int, int, int]) -> tuple[bool, int]:
+    """Advance the rows of one stripe from the current half of the buffer into the other one.
+
+    Only the stripe itself and the border row above and below it are read.
+    Return whether any cell of the stripe changed and the population of the stripe.
+    """
+    current, first, last = task
+    buffer, height, row_bytes, mask = (_worker["buffer"], _worker["height"],
+                                       _worker["row_bytes"], _worker["mask"])
+    step_row = _worker["step_row"]
+    src = current * height * row_bytes
+    dst = (1 - current) * height * row_bytes
+
+    # Stripe plus halo rows, rows outside of the board are dead
+    rows = [int.from_bytes(buffer[src + i * row_bytes:src + (i + 1) * row_bytes], "little")
+            if 0 <= i < height else 0
+            for i in range(first - 1, last + 1)]
+
+    changed, population = False, 0
+    for i in range(first, last):
+        row = rows[i - first + 1]
+        new_row = step_row(rows[i - first], row, rows[i - first + 2], mask)
+        buffer[dst + i * row_bytes:dst + (i + 1) * row_bytes] = new_row.to_bytes(row_bytes, "little")
+        changed = changed or new_row != row
+        population += new_row.bit_count()
+
+    return changed, population
+
+
+class ParallelEngine(Engine):
+    """Multi-core engine, steps horizontal stripes of the board in a process pool.
+
+    The bit-packed board lives in a shared memory buffer with two halves,
+    one for the current and one for the next generation. Each worker only
+    reads its own stripe and the border rows of its neighbours, so no board
+    data has to be sent between processes.
+    """
+    def __init__(self, board: list[list[bool]], rule: Rule = CONWAY, workers: int = 0):
+        # Only imported when needed, starting the other engines stays fast
+        import multiprocessing  # pylint: disable=import-outside-toplevel
+        super().__init__(board, rule)
+        workers = min(workers or os.cpu_count() or 1, self.height)
+        self.row_bytes: int = (self.width + 7) // 8
+        self.current: int = 0  # Half of the buffer that holds the current generation
+
+        self.buffer = multiprocessing.RawArray("B", 2 * self.height * self.row_bytes)
+        self.view = memoryview(self.buffer).cast("B")
+        self._population: int = 0
+        for i, packed in enumerate(packed_rows(board)):
+            self.view[i * self.row_bytes:(i + 1) * self.row_bytes] = \
+                packed.to_bytes(self.row_bytes, "little")
+            self._population += packed.bit_count()
+
+        # Split the board into stripes of (nearly) the same height
+        bounds = [self.height * i // workers for i in range(workers + 1)]
+        self.stripes: list[tuple[int, int]] = list(zip(bounds, bounds[1:]))
+
+        self.pool = multiprocessing.Pool(workers, _init_worker,
+                                         (self.buffer, self.height, self.width, rule.name))
+        # Don't leave worker processes behind when end_game() exits the program
+        atexit.register(self.close)
+
+    def step(self) -> bool:
+        results = self.pool.map(_step_stripe,
+                                [(self.current, first, last) for first, last in self.stripes])
+        self.current = 1 - self.current
+        self._population = sum(population for _, population in results)
+        return any(changed for changed, _ in results)
+
+    def population(self) -> int:
+        return self._population
+
+    def fingerprint(self) -> int:
+        size = self.height * self.row_bytes
+        return hash(bytes(self.view[self.current * size:(self.current + 1) * size]))
+
+    def to_board(self) -> list[list[bool]]:
+        return [unpack_row(row, self.width) for row in self.packed_rows()]
+
+    def window(self, top: int, left: int, height: int, width: int) -> list[list[bool]]:
+        return unpack_window(self.packed_rows(top, top + height), left, width)
+
+    def packed_rows(self, first: int = 0, last: int = -1) -> list[int]:
+        # Only the rows first to last (exclusive) are read from the buffer
+        last = self.height if last == -1 else last
+        offset = self.current * self.height * self.row_bytes
+        return [int.from_bytes(
+                    self.view[offset + i * self.row_bytes:offset + (i + 1) * self.row_bytes],
+                    "little")
+                for i in range(first, last)]
+
+    def info(self) -> str:
+        workers = len(self.stripes)
+        return f"{workers} worker process{'es' if workers != 1 else ''}"
+
+    def close(self) -> None:
+        self.pool.terminate()
+        self.pool.join()
+
+
+class SparseEngine(Engine):
+    """Sparse engine, stores only the coordinates of live cells.
+
+    Only live cells and their neighbours are looked at, so the cost of a
+    generation depends on the population and not on the size of the board.
+    """
+    # Relative positions of the 8 neighbours of a cell
+    OFFSETS: tuple = ((-1, -1), (-1, 0), (-1, 1),
+                      (0, -1),           (0, 1),
+                      (1, -1),  (1, 0),  (1, 1))
+
+    def __init__(self, board: list[list[bool]], rule: Rule = CONWAY):
+        super().__init__(board, rule)
+        self.live: set[tuple[int, int]] = {(i, j) for i, row in enumerate(board)
+                                           for j, cell in enumerate(row) if cell}
+
+    def step(self) -> bool:
+        live = self.live
+        height, width = self.height, self.width
+        # Every live cell adds one to the count of each of its neighbours
+        counts = Counter((i + di, j + dj) for i, j in live for di, dj in self.OFFSETS)
+
+        table = self.rule.table
+        new_live = {(i, j) for (i, j), live_neighbors in counts.items()
+                    # Cells outside of the board are always dead
+                    if 0 <= i < height and 0 <= j < width
+                    and table[9 * ((i, j) in live) + live_neighbors]}
+        if table[9]:
+            # Rule with S0, live cells without any neighbours aren't counted
+            new_live.update(cell for cell in live if cell not in counts)
+
+        changed = new_live != live
+        self.live = new_live
+        return changed
+
+    def population(self) -> int:
+        return len(self.live)
+
+    def fingerprint(self) -> int:
+        return hash(frozenset(self.live))
+
+    def to_board(self) -> list[list[bool]]:
+        local_board = [[False] * self.width for _ in range(self.height)]
+        for i, j in self.live:
+            local_board[i][j] = True
+        return local_board
+
+    def window(self, top: int, left: int, height: int, width: int) -> list[list[bool]]:
+        local_board = [[False] * width for _ in range(height)]
+        for i, j in self.live:
+            if top <= i < top + height and left <= j < left + width:
+                local_board[i - top][j - left] = True
+        return local_board
+
+    def packed_rows(self) -> list[int]:
+        rows = [0] * self.height
+        for i, j in self.live:
+            rows[i] |= 1 << j
+        return rows
+
+
+class ChunkEngine(Engine):
+    """Unbounded engine, stores the world as a dict of square chunks of bit-packed rows.
+
+    Chunks are created when live cells reach the edge of a neighbouring chunk
+    and freed after they have been empty for a while, so the memory follows
+    the live cells instead of a bounding rectangle. Like with hashlife, the
+    board only is a window into the world.
+    """
+    unbounded = True
+
+    def __init__(self, board: list[list[bool]], rule: Rule = CONWAY, chunk_size: int = 64, free_after: int = 16):
+        super().__init__(board, rule)
+        self.size: int = chunk_size
+        self.mask: int = (1 << chunk_size) - 1
+        # Chunks are freed after being empty for this many generations
+        self.free_after: int = free_after
+        # (chunk row, chunk column) -> rows of the chunk, bit j is column j of the chunk
+        self.chunks: dict[tuple[int, int], list[int]] = {}
+        # Chunk -> generations it has been empty for
+        self.empty: dict[tuple[int, int], int] = {}
+        self._population: int = 0
+
+        size = self.size
+        for i, packed in enumerate(packed_rows(board)):
+            cx = 0
+            while packed:
+                if packed & self.mask:
+                    chunk = self.chunks.setdefault((i // size, cx), [0] * size)
+                    chunk[i % size] = packed & self.mask
+                packed >>= size
+                cx += 1
+        self._population = sum(row.bit_count() for rows in self.chunks.values() for row in rows)
+
+    def _active(self) -> set[tuple[int, int]]:
+        """Return the chunks that have to be computed: all chunks, plus the neighbours
+        of chunks with live cells at their edge."""
+        size = self.size
+        active = set(self.chunks)
+        for (cy, cx), rows in self.chunks.items():
+            columns = 0
+            for row in rows:
+                columns |= row
+            if not columns:
+                continue
+            left, right = columns & 1, columns >> (size - 1)
+            # Edges and corners of the chunk, and the neighbour they can grow into
+            for alive, dy, dx in ((rows[0], -1, 0), (rows[-1], 1, 0), (left, 0, -1), (right, 0, 1),
+                                  (rows[0] & 1, -1, -1), (rows[0] >> (size - 1), -1, 1),
+                                  (rows[-1] & 1, 1, -1), (rows[-1] >> (size - 1), 1, 1)):
+                if alive:
+                    active.add((cy + dy, cx + dx))
+        return active
+
+    def step(self) -> bool:
+        size, chunks = self.size, self.chunks
+        step_row = self.rule.step_row
+        # Chunk rows are shifted left by one, with a column of the neighbours on both sides
+        wide_mask = (1 << (size + 2)) - 1
+        zeros = [0] * size
+        new_chunks: dict[tuple[int, int], list[int]] = {}
+        changed = False
+        population = 0
+
+        for key in self._active():
+            cy, cx = key
+            rows = chunks.get(key, zeros)
+            left = chunks.get((cy, cx - 1), zeros)
+            right = chunks.get((cy, cx + 1), zeros)
+            # Rows above and below the chunk, each with the corner cells of the diagonal chunks
+            above = ((chunks.get((cy - 1, cx - 1), zeros)[-1] >> (size - 1))
+                     | chunks.get((cy - 1, cx), zeros)[-1] << 1
+                     | (chunks.get((cy - 1, cx + 1), zeros)[-1] & 1) << (size + 1))
+            below = ((chunks.get((cy + 1, cx - 1), zeros)[0] >> (size - 1))
+                     | chunks.get((cy + 1, cx), zeros)[0] << 1
+                     | (chunks.get((cy + 1, cx + 1), zeros)[0] & 1) << (size + 1))
+            wide = [above,
+                    *((left[i] >> (size - 1)) | rows[i] << 1 | (right[i] & 1) << (size + 1)
+                      for i in range(size)),
+                    below]
+
+            new_rows = [step_row(wide[i], wide[i + 1], wide[i + 2], wide_mask) >> 1 & self.mask
+                        for i in range(size)]
+            changed = changed or new_rows != rows
+
+            if any(new_rows):
+                # Counted while the rows are at hand, population() doesn't read the chunks again
+                population += sum(row.bit_count() for row in new_rows)
+                self.empty.pop(key, None)
+            else:
+                self.empty[key] = self.empty.get(key, 0) + 1
+                if self.empty[key] > self.free_after or key not in chunks:
+                    # Free chunks that stayed empty, never create empty ones
+                    del self.empty[key]
+                    continue
+            new_chunks[key] = new_rows
+
+        self.chunks = new_chunks
+        self._population = population
+        return changed
+
+    def population(self) -> int:
+        return self._population
+
+    def fingerprint(self) -> int:
+        # Bytes, hash() of an int would mix up bits 0-2 and 61-63 of the rows
+        size = (self.size + 7) // 8
+        return hash(frozenset((key, b"".join(row.to_bytes(size, "little") for row in rows))
+                              for key, rows in self.chunks.items() if any(rows)))
+
+    def _row(self, i: int, left: int, width: int) -> int:
+        """Return the columns left to left + width of row i of the world, packed like pack_row()."""
+        size = self.size
+        cy, row = divmod(i, size)
+        packed = 0
+        first = left // size
+        for cx in range(first, (left + width - 1) // size + 1):
+            chunk = self.chunks.get((cy, cx))
+            if chunk is not None:
+                packed |= chunk[row] << ((cx - first) * size)
+        return packed >> (left - first * size) & ((1 << width) - 1)
+
+    def to_board(self) -> list[list[bool]]:
+        return self.window(0, 0, self.height, self.width)
+
+    def window(self, top: int, left: int, height: int, width: int) -> list[list[bool]]:
+        return [unpack_row(self._row(i, left, width), width) for i in range(top, top + height)]
+
+    def packed_rows(self) -> list[int]:
+        return [self._row(i, 0, self.width) for i in range(self.height)]
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        size = self.size
+        box = None
+        for (cy, cx), rows in self.chunks.items():
+            chunk_box = bounding_box(rows)
+            if chunk_box is None:
+                continue
+            top, left, bottom, right = chunk_box
+            top, bottom, left, right = cy * size + top, cy * size + bottom, cx * size + left, cx * size + right
+            if box is not None:
+                top, left = min(top, box[0]), min(left, box[1])
+                bottom, right = max(bottom, box[2]), max(right, box[3])
+            box = top, left, bottom, right
+        return box
+
+    def region_rows(self, top: int, left: int, height: int, width: int) -> list[int]:
+        return [self._row(i, left, width) for i in range(top, top + height)]
+
+    def info(self) -> str:
+        if not self.chunks:
+            return "Chunks: 0"
+        rows = [cy for cy, _ in self.chunks]
+        columns = [cx for _, cx in self.chunks]
+        return (f"Chunks: {len(self.chunks)} of {self.size}x{self.size} cells, "
+                f"spread over {max(rows) - min(rows) + 1}x{max(columns) - min(columns) + 1} chunks")
+
+
+class _CacheFull(Exception):
+    """Raised during a jump of the hashlife engine once the node cache outgrew its budget."""
+
+
+class QuadNode:
+    """Canonical node of a HashLife quadtree.
+
+    A node of level k is a square of 2^k * 2^k cells made of the four
+    level k - 1 nodes a (top left), b (top right), c (bottom left) and d (bottom right).
+    Level 0 nodes are single cells without children.
+    """
+    __slots__ = ("a", "b", "c", "d", "k", "n", "h")
+
+    def __init__(self, a, b, c, d, k: int, n: int):
+        self.a, self.b, self.c, self.d = a, b, c, d
+        self.k: int = k  # Level
+        self.n: int = n  # Population
+        # Hash of the content, doesn't depend on the identity of the node
+        self.h: int = n if k == 0 else hash((a.h, b.h, c.h, d.h))
+
+
+class HashLifeEngine(Engine):
+    """HashLife engine, jumps ahead by huge amounts of generations at once.
+
+    Nodes are canonicalised, so identical regions of the board share one node,
+    and the result of advancing a node is memoised. Repetitive patterns can
+    therefore be advanced by millions of generations in milliseconds.
+
+    The HashLife engine simulates an UNBOUNDED board: cells outside of the
+    board don't die, the board from the file is only the visible window.
+    For the dead border of the other engines, use them with -j instead.
+    """
+    unbounded = True
+
+    def __init__(self, board: list[list[bool]], rule: Rule = CONWAY, max_nodes: int = 1_000_000):
+        super().__init__(board, rule)
+        self.max_nodes: int = max_nodes
+        # Canonical nodes, keyed by their children
+        self.nodes: dict[tuple, QuadNode] = {}
+        # Memoised results of successor(), keyed by node and step exponent
+        self.results: dict[tuple, QuadNode] = {}
+        self.zeros: list[QuadNode] = []
+        self.hits: int = 0
+        self.misses: int = 0
+        # Size of the node cache at which the current jump is split into two smaller ones
+        self.split_above: float = float("inf")
+
+        self.off = QuadNode(None, None, None, None, 0, 0)
+        self.on = QuadNode(None, None, None, None, 0, 1)
+
+        # Smallest square that covers the whole board
+        level = max(self.height, self.width, 2).bit_length()
+        self.root: QuadNode = self._build(list(packed_rows(board)), 0, 0, level)
+        # Board coordinates of the top left corner of the root
+        self.origin: tuple[int, int] = (0, 0)
+
+    def _join(self, a: QuadNode, b: QuadNode, c: QuadNode, d: QuadNode) -> QuadNode:
+        """Return the canonical node with the specified children."""
+        key = (a, b, c, d)
+        node = self.nodes.get(key)
+        if node is None:
+            node = QuadNode(a, b, c, d, a.k + 1, a.n + b.n + c.n + d.n)
+            self.nodes[key] = node
+        return node
+
+    def _zero(self, k: int) -> QuadNode:
+        """Return the empty node of level k."""
+        while len(self.zeros) <= k:
+            if not self.zeros:
+                self.zeros.append(self.off)
+            else:
+                z = self.zeros[-1]
+                self.zeros.append(self._join(z, z, z, z))
+        return self.zeros[k]
+
+    def _build(self, rows: list[int], row: int, col: int, k: int) -> QuadNode:
+        """Build the node of level k with its top left corner at the specified cell.
+
+        The rows are bit-packed with pack_row().
+        """
+        size = 1 << k
+        # Bits of the columns covered by the node
+        mask = ((1 << size) - 1) << col
+        if not any(packed & mask for packed in rows[row:row + size]):
+            # No live cells, or completely outside of the board
+            return self._zero(k)
+        if k == 0:
+            return self.on
+
+        half = size >> 1
+        return self._join(self._build(rows, row, col, k - 1),
+                          self._build(rows, row, col + half, k - 1),
+                          self._build(rows, row + half, col, k - 1),
+                          self._build(rows, row + half, col + half, k - 1))
+
+    def _centre(self, m: QuadNode) -> QuadNode:
+        """Return the node one level up with m in its centre, surrounded by dead cells."""
+        z = self._zero(m.k - 1)
+        return self._join(self._join(z, z, z, m.a), self._join(z, z, m.b, z),
+                          self._join(z, m.c, z, z), self._join(m.d, z, z, z))
+
+    def _life_4x4(self, m: QuadNode) -> QuadNode:
+        """Return the centre 2x2 cells of a 4x4 node after one generation."""
+        cells = [[m.a.a.n, m.a.b.n, m.b.a.n, m.b.b.n],
+                 [m.a.c.n, m.a.d.n, m.b.c.n, m.b.d.n],
+                 [m.c.a.n, m.c.b.n, m.d.a.n, m.d.b.n],
+                 [m.c.c.n, m.c.d.n, m.d.c.n, m.d.d.n]]
+        centre: list[QuadNode] = []
+        for i in (1, 2):
+            for j in (1, 2):
+                live_neighbors = (sum(cells[i - 1][j - 1:j + 2]) + sum(cells[i + 1][j - 1:j + 2])
+                                  + cells[i][j - 1] + cells[i][j + 1])
+                alive = self.rule.table[9 * cells[i][j] + live_neighbors]
+                centre.append(self.on if alive else self.off)
+        return self._join(*centre)
+
+    def _successor(self, m: QuadNode, j: int) -> QuadNode:
+        """Return the centre of m (one level down) advanced by 2^j generations.
+
+        j can be at most m.k - 2.
+        """
+        if m.n == 0:
+            return m.a
+
+        key = (m, j)
+        result = self.results.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        if len(self.nodes) > self.split_above:
+            raise _CacheFull
+
+        if m.k == 2:
+            result = self._life_4x4(m)
+        else:
+            join, successor = self._join, self._successor
+            # Sub-squares are one level smaller, so they can advance at most 2^(k - 3)
+            sub_j = min(j, m.k - 3)
+            # 9 overlapping sub-squares of level k - 1, advanced and reduced to level k - 2
+            c1 = successor(m.a, sub_j)
+            c2 = successor(join(m.a.b, m.b.a, m.a.d, m.b.c), sub_j)
+            c3 = successor(m.b, sub_j)
+            c4 = successor(join(m.a.c, m.a.d, m.c.a, m.c.b), sub_j)
+            c5 = successor(join(m.a.d, m.b.c, m.c.b, m.d.a), sub_j)
+            c6 = successor(join(m.b.c, m.b.d, m.d.a, m.d.b), sub_j)
+            c7 = successor(m.c, sub_j)
+            c8 = successor(join(m.c.b, m.d.a, m.c.d, m.d.c), sub_j)
+            c9 = successor(m.d, sub_j)
+
+            if j < m.k - 2:
+                # Already advanced far enough, only take the centres
+                result = join(join(c1.d, c2.c, c4.b, c5.a), join(c2.d, c3.c, c5.b, c6.a),
+                              join(c4.d, c5.c, c7.b, c8.a), join(c5.d, c6.c, c8.b, c9.a))
+            else:
+                # Advance a second time, 2 * 2^(k - 3) = 2^(k - 2) generations in total
+                result = join(successor(join(c1, c2, c4, c5), sub_j),
+                              successor(join(c2, c3, c5, c6), sub_j),
+                              successor(join(c4, c5, c7, c8), sub_j),
+                              successor(join(c5, c6, c8, c9), sub_j))
+
+        if len(self.results) > self.max_nodes:
+            # Results are only a shortcut, the nodes they point to are dropped by _collect_garbage()
+            self.results.clear()
+        self.results[key] = result
+        return result
+
+    def _advance_pow2(self, j: int) -> None:
+        """Advance the root by 2^j generations.
+
+        If the node cache outgrows max_nodes on the way, the nodes that aren't
+        part of the board are dropped and the jump is split into two jumps of
+        2^(j - 1) generations. Single generations are never split.
+        """
+        root = self.root
+        # Make room so that the pattern can't grow out of the root
+        while root.k < j + 2 or self._join(root.a.d, root.b.c, root.c.b, root.d.a).n != root.n:
+            half = 1 << (root.k - 1)
+            self.origin = (self.origin[0] - half, self.origin[1] - half)
+            root = self._centre(root)
+        # Same board with more room, kept if the jump is split
+        self.root = root
+
+        if j:
+            if len(self.nodes) > self.max_nodes // 2:
+                self._collect_garbage()
+            # Splitting doesn't help if the board alone needs most of the budget
+            self.split_above = max(self.max_nodes, 2 * len(self.nodes))
+        try:
+            # The result covers exactly the same cells as root
+            self.root = self._successor(self._centre(root), j)
+        except _CacheFull:
+            for _ in range(2):
+                self._advance_pow2(j - 1)
+        finally:
+            self.split_above = float("inf")
+
+    def _collect_garbage(self) -> None:
+        """Drop memoised results and all nodes that aren't part of the current board.
+
+        Keeps the node cache bounded by max_nodes.
+        """
+        self.results.clear()
+        old_nodes, self.nodes = self.nodes, {}
+        stack = [self.root, *self.zeros]
+        while stack:
+            node = stack.pop()
+            if node.k == 0 or (node.a, node.b, node.c, node.d) in self.nodes:
+                continue
+            self.nodes[(node.a, node.b, node.c, node.d)] = node
+            stack.extend((node.a, node.b, node.c, node.d))
+        del old_nodes
+
+    def advance(self, generations: int) -> None:
+        # Advance by the powers of two that make up the amount of generations
+        j = 0
+        while generations:
+            if generations & 1:
+                self._advance_pow2(j)
+                if len(self.nodes) > self.max_nodes:
+                    self._collect_garbage()
+            generations >>= 1
+            j += 1
+
+    def step(self) -> bool:
+        old_root = self.root
+        self.advance(1)
+
+        # Bring the old root to the same size before comparing, nodes are canonical
+        while old_root.k < self.root.k:
+            old_root = self._centre(old_root)
+        return old_root is not self.root
+
+    def population(self) -> int:
+        return self.root.n
+
+    def fingerprint(self) -> int:
+        root, (row, col) = self.root, self.origin
+        # Strip the padding of empty cells, so that it doesn't change the fingerprint
+        while root.k >= 2:
+            inner = self._join(root.a.d, root.b.c, root.c.b, root.d.a)
+            if inner.n != root.n:
+                break
+            quarter = 1 << (root.k - 2)
+            root, row, col = inner, row + quarter, col + quarter
+        return hash((root.h, root.k, row, col))
+
+    def to_board(self) -> list[list[bool]]:
+        return self.window(0, 0, self.height, self.width)
+
+    def window(self, top: int, left: int, height: int, width: int) -> list[list[bool]]:
+        local_board = [[False] * width for _ in range(height)]
+        # Positions relative to the top left corner of the window
+        stack = [(self.root, self.origin[0] - top, self.origin[1] - left)]
+        while stack:
+            node, row, col = stack.pop()
+            size = 1 << node.k
+            if (node.n == 0 or row >= height or col >= width
+                    or row + size <= 0 or col + size <= 0):
+                # Empty or outside of the visible window
+                continue
+            if node.k == 0:
+                local_board[row][col] = True
+                continue
+
+            half = size >> 1
+            stack.extend(((node.a, row, col), (node.b, row, col + half),
+                          (node.c, row + half, col), (node.d, row + half, col + half)))
+        return local_board
+
+    def _box(self, node: QuadNode, boxes: dict) -> tuple[int, int, int, int] | None:
+        """Return the bounding box of the live cells of a node, relative to its top left corner.
+
+        Boxes of nodes are memoised in boxes, identical regions are only looked at once.
+        """
+        if node.n == 0:
+            return None
+        if node.k == 0:
+            return 0, 0, 0, 0
+        box = boxes.get(node)
+        if box is None:
+            half = 1 << (node.k - 1)
+            top = left = 1 << node.k
+            bottom = right = -1
+            for child, row, col in ((node.a, 0, 0), (node.b, 0, half), (node.c, half, 0), (node.d, half, half)):
+                child_box = self._box(child, boxes)
+                if child_box is not None:
+                    top, left = min(top, row + child_box[0]), min(left, col + child_box[1])
+                    bottom, right = max(bottom, row + child_box[2]), max(right, col + child_box[3])
+            box = boxes[node] = top, left, bottom, right
+        return box
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        box = self._box(self.root, {})
+        if box is None:
+            return None
+        row, col = self.origin
+        return row + box[0], col + box[1], row + box[2], col + box[3]
+
+    def region_rows(self, top: int, left: int, height: int, width: int) -> list[int]:
+        rows = [0] * height
+        stack = [(self.root, self.origin[0] - top, self.origin[1] - left)]
+        while stack:
+            node, row, col = stack.pop()
+            size = 1 << node.k
+            if (node.n == 0 or row >= height or col >= width
+                    or row + size <= 0 or col + size <= 0):
+                continue
+            if node.k == 0:
+                rows[row] |= 1 << col
+                continue
+
+            half = size >> 1
+            stack.extend(((node.a, row, col), (node.b, row, col + half),
+                          (node.c, row + half, col), (node.d, row + half, col + half)))
+        return rows
+
+    def info(self) -> str:
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0
+        return (f"Node cache: {len(self.nodes)} nodes, {len(self.results)} results, "
+                f"hit rate {hit_rate:.1f} %")
+
+
+# Engines selectable with the -m argument
+ENGINES: dict[str, type[Engine]] = {
+    "list": ListEngine,
+    "tiled": TileEngine,
+    "numpy": NumpyEngine,
+    "bits": BitEngine,
+    "table": LookupEngine,
+    "sparse": SparseEngine,
+    "chunked": ChunkEngine,
+    "hashlife": HashLifeEngine,
+    "parallel": ParallelEngine,
+}
@@ -0,0 +1,153 @@
+"""History of past generations, stored as compressed keyframes and XOR deltas.
+
+Every keyframe_interval generations, the whole board is stored. The
+generations in between only store the rows that changed since the
+generation before, XORed with their old version, which is mostly zeros
+and compresses very well. A keyframe and its deltas
+form a segment, the oldest segments are dropped once the history uses more
+memory than its budget.
+"""
+import threading
+import zlib
+from bisect import bisect_right
+from itertools import compress
+from operator import ne
+
+from engines import unpack_window
+from loaders import unpack_row
+
+# Fast compression, the deltas are mostly zeros anyway
+COMPRESSION_LEVEL: int = 1
+# Bytes of the row index in front of every changed row of a delta
+INDEX_BYTES: int = 4
+
+
+class Snapshot:
+    """Board of a past generation, with the window() of an engine so the viewport can show it."""
+    def __init__(self, rows: list[int], width: int):
+        self.rows: list[int] = rows
+        self.width: int = width
+
+    def window(self, top: int, left: int, height: int, width: int) -> list[list[bool]]:
+        return unpack_window(self.rows[top:top + height], left, width)
+
+    def to_board(self) -> list[list[bool]]:
+        return [unpack_row(row, self.width) for row in self.rows]
+
+
+class Segment:
+    """A compressed keyframe and the compressed deltas of the generations after it."""
+    def __init__(self, first: int, keyframe: bytes):
+        self.first: int = first  # Generation of the keyframe
+        self.keyframe: bytes = keyframe
+        self.deltas: list[bytes] = []
+        self.size: int = len(keyframe)
+
+
+class History:
+    """Bounded store of the generations of a board with height rows and width columns.
+
+    record() is called by the simulation worker, the main thread reads
+    generations with snapshot() at the same time, so all access is locked.
+    """
+    def __init__(self, height: int, width: int, budget: int, keyframe_interval: int = 64):
+        self.height: int = height
+        self.row_bytes: int = (width + 7) // 8
+        self.width: int = width
+        self.budget: int = budget  # In bytes
+        self.keyframe_interval: int = keyframe_interval
+        self.segments: list[Segment] = []
+        self.firsts: list[int] = []  # Generation of the keyframe of each segment, for bisect
+        self.size: int = 0
+        self.last: int = -1  # Latest recorded generation
+        self.last_rows: list[int] = []  # Rows of the latest recorded generation
+        self.lock = threading.Lock()
+
+    def _pack(self, rows: list[int]) -> bytes:
+        """Return the rows as bytes, like in a .golb file."""
+        row_bytes = self.row_bytes
+        return b"".join(row.to_bytes(row_bytes, "little") for row in rows)
+
+    def record(self, generation: int, rows: list[int], dirty: list[int] | None = None) -> None:
+        """Store a generation, given as packed rows (see pack_row()).
+
+        dirty are the rows that changed since the generation before, if the
+        engine knows them, otherwise the rows are compared. Generations have
+        to be recorded in order, after a gap the next one starts a new keyframe.
+        """
+        with self.lock:
+            segment = self.segments[-1] if self.segments else None
+            last_rows, row_bytes = self.last_rows, self.row_bytes
+            if (segment is None or generation != self.last + 1
+                    or len(segment.deltas) + 1 >= self.keyframe_interval):
+                segment = Segment(generation, zlib.compress(self._pack(rows), COMPRESSION_LEVEL))
+                self.segments.append(segment)
+                self.firsts.append(generation)
+                self.size += segment.size
+                self.last_rows = list(rows)
+            else:
+                if dirty is None:
+                    dirty = list(compress(range(len(rows)), map(ne, rows, last_rows)))
+                # Index and XOR of every changed row, only the changed rows are packed
+                delta = b"".join(i.to_bytes(INDEX_BYTES, "little")
+                                 + (rows[i] ^ last_rows[i]).to_bytes(row_bytes, "little")
+                                 for i in dirty)
+                for i in dirty:
+                    last_rows[i] = rows[i]
+                delta = zlib.compress(delta, COMPRESSION_LEVEL)
+                segment.deltas.append(delta)
+                segment.size += len(delta)
+                self.size += len(delta)
+            self.last = generation
+
+            # Drop the oldest segments, never the one that is being recorded
+            while self.size > self.budget and len(self.segments) > 1:
+                self.size -= self.segments.pop(0).size
+                self.firsts.pop(0)
+
+    @property
+    def first(self) -> int:
+        """Oldest generation that is still stored, -1 if there is none."""
+        with self.lock:
+            return self.firsts[0] if self.firsts else -1
+
+    def __contains__(self, generation: int) -> bool:
+        with self.lock:
+            return bool(self.firsts) and self.firsts[0] <= generation <= self.last
+
+    def rows(self, generation: int) -> list[int]:
+        """Return the packed rows of a stored generation. Raises KeyError if it isn't stored."""
+        with self.lock:
+            index = bisect_right(self.firsts, generation) - 1
+            if index < 0 or generation > self.last:
+                raise KeyError(generation)
+            segment = self.segments[index]
+            if generation - segment.first > len(segment.deltas):
+                raise KeyError(generation)
+            keyframe, deltas = segment.keyframe, segment.deltas[:generation - segment.first]
+
+        # Decompressed outside of the lock, the worker doesn't have to wait
+        row_bytes = self.row_bytes
+        cells_bytes = zlib.decompress(keyframe)
+        rows = [int.from_bytes(cells_bytes[i:i + row_bytes], "little")
+                for i in range(0, len(cells_bytes), row_bytes)]
+        entry = INDEX_BYTES + row_bytes
+        for delta in deltas:
+            data = zlib.decompress(delta)
+            for start in range(0, len(data), entry):
+                i = int.from_bytes(data[start:start + INDEX_BYTES], "little")
+                rows[i] ^= int.from_bytes(data[start + INDEX_BYTES:start + entry], "little")
+        return rows
+
+    def snapshot(self, generation: int) -> Snapshot:
+        """Return a stored generation as a board the viewport can capture."""
+        return Snapshot(self.rows(generation), self.width)
+
+    def describe(self) -> str:
+        """Return the stored generations and the memory used, for the status line."""
+        with self.lock:
+            if not self.firsts:
+                return "History: empty"
+            first, last, size = self.firsts[0], self.last, self.size
+        return (f"History: generations {first + 1}-{last + 1}, "
+                f"{size / 2 ** 20:.1f} of {self.budget / 2 ** 20:.3g} MB")
@@ -0,0 +1,395 @@
+"""Streaming readers for pattern files.
+
+Supported formats are the .gol files of this game, plaintext .cells files,
+run length encoded .rle files and Life 1.06 (.lif or .life) files.
+Files are read line by line and turned into rows of cells one at a time,
+so the whole text is never held in memory.
+
+Boards can also be saved in a compact binary format (.golb), which is used
+for checkpoints. It stores 1 bit per cell and is memory mapped when loaded.
+"""
+import os
+import re
+import mmap
+import struct
+from hashlib import blake2b
+from typing import Callable, Iterable, Iterator, TextIO
+
+
+class FileInvalidError(Exception):
+    """Custom error for pattern files that don't pass the validity check."""
+    def __init__(
+        self,
+        message="File didn't pass the validity check. "
+        "All characters must be printable and all lines must have the same length."):
+        self.message = message
+        super().__init__(self.message)
+
+
+def read_gol(fp: TextIO) -> Iterator[list[bool]]:
+    """Read a .gol file, every character other than a space is a live cell.
+
+    All lines must have the same length, only the last one can be shorter.
+    """
+    width = -1
+    short_line = False
+    for line in fp:
+        line = line.strip("\n")
+        if not line:
+            # Avoids empty rows, they exist for some reason
+            continue
+        if short_line or not line.isprintable() or (width != -1 and len(line) > width):
+            raise FileInvalidError
+        if width == -1:
+            width = len(line)
+        # Only the last line may be shorter
+        short_line = len(line) < width
+
+        # Convert char to bool value
+        yield [not char == " " for char in line]
+
+
+def measure_gol(fp: TextIO) -> tuple[int, int]:
+    """Return the height and width of a .gol file, without checking its cells."""
+    height = width = 0
+    for line in fp:
+        line = line.strip("\n")
+        if line:
+            height += 1
+            # The first line is the widest, read_gol() checks the others
+            width = width or len(line)
+    return height, width
+
+
+def read_cells(fp: TextIO) -> Iterator[list[bool]]:
+    """Read a plaintext .cells file. "O" is a live cell, "." a dead one.
+
+    Lines starting with "!" are comments. Lines can be shorter than the pattern is wide.
+    """
+    for line in fp:
+        line = line.rstrip("\r\n")
+        if line.startswith("!"):
+            continue
+        if line.strip(".O*"):
+            raise FileInvalidError("Plaintext files may only contain \".\" and \"O\".")
+        yield [char != "." for char in line]
+
+
+def measure_cells(fp: TextIO) -> tuple[int, int]:
+    """Return the height and width of a plaintext .cells file, without checking its cells."""
+    height = width = 0
+    for line in fp:
+        line = line.rstrip("\r\n")
+        if not line.startswith("!"):
+            height += 1
+            width = max(width, len(line))
+    return height, width
+
+
+def pack_row(row: list[bool]) -> int:
+    """Pack a row of cells into an int, the first cell ends up in the lowest bit."""
+    return int("".join("1" if cell else "0" for cell in reversed(row)), 2)
+
+
+def unpack_row(packed: int, width: int) -> list[bool]:
+    """Unpack an int created by pack_row() back into a row of cells."""
+    # Lowest bit first, padded to the width of the board
+    return [char == "1" for char in reversed(f"{packed:0{width}b}")]
+
+
+# Header line of .rle files, e.g. "x = 3, y = 3, rule = B3/S23"
+RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*(\S+))?")
+
+
+def read_rle(fp: TextIO) -> Iterator[list[bool]]:
+    """Read a run length encoded .rle file.
+
+    "b" is a dead cell, every other letter a live one, "$" ends a row and
+    "!" ends the pattern. A number before any of them repeats it.
+    All rows are padded to the size from the header.
+    """
+    row: list[bool] = []
+    count = ""
+    width = height = -1
+    rows = 0
+    finished = False
+    row_ended = False  # Last thing in the file was a "$"
+
+    for line in fp:
+        if finished:
+            break
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if width == -1:
+            header = RLE_HEADER.match(line)
+            if header is None:
+                raise FileInvalidError("The .rle file has no valid \"x = ..., y = ...\" header.")
+            width, height = int(header.group(1)), int(header.group(2))
+            continue
+
+        for char in line:
+            if char.isdigit():
+                count += char
+                continue
+
+            run = int(count) if count else 1
+            count = ""
+            if char == "!":
+                # "$!" ends the pattern without another row
+                if row or not row_ended:
+                    rows += 1
+                    if rows > height:
+                        raise FileInvalidError("The .rle file has more rows than its header says.")
+                    yield row + [False] * (width - len(row))
+                row = []
+                finished = True
+                break
+            if char == "$":
+                # Finish the row, more than one $ means empty rows in between
+                rows += run
+                if rows > height:
+                    raise FileInvalidError("The .rle file has more rows than its header says.")
+                yield row + [False] * (width - len(row))
+                for _ in range(run - 1):
+                    yield [False] * width
+                row = []
+                row_ended = True
+            elif char.isalpha() or char == ".":
+                row.extend([char not in "b."] * run)
+                row_ended = False
+                if len(row) > width:
+                    raise FileInvalidError("A row of the .rle file is wider than its header says.")
+            elif not char.isspace():
+                raise FileInvalidError(f"Invalid character \"{char}\" in the .rle file.")
+
+    if row and not finished:
+        # File ended without "!"
+        rows += 1
+        if rows > height:
+            raise FileInvalidError("The .rle file has more rows than its header says.")
+        yield row + [False] * (width - len(row))
+
+    # Empty rows at the bottom aren't written in the file
+    for _ in range(height - rows):
+        yield [False] * width
+
+
+def measure_rle(fp: TextIO) -> tuple[int, int]:
+    """Return the height and width of a .rle file from its header."""
+    for line in fp:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            header = RLE_HEADER.match(line)
+            if header is None:
+                break
+            return int(header.group(2)), int(header.group(1))
+    raise FileInvalidError("The .rle file has no valid \"x = ..., y = ...\" header.")
+
+
+def read_rle_rule(fp: TextIO) -> str:
+    """Return the rule from the header of a .rle file, or an empty string if there is none."""
+    for line in fp:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            header = RLE_HEADER.match(line)
+            return header.group(3) or "" if header else ""
+    return ""
+
+
+def life106_cells(fp: TextIO) -> Iterator[tuple[int, int]]:
+    """Iterate over the x and y coordinate of every live cell of a Life 1.06 file."""
+    for line in fp:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            if line.startswith("#Life 1.05"):
+                raise FileInvalidError("Only Life 1.06 files are supported, not Life 1.05.")
+            continue
+        try:
+            x, y = (int(value) for value in line.split())
+        except ValueError as ex:
+            raise FileInvalidError(f"Invalid line \"{line}\" in the Life 1.06 file.") from ex
+        yield x, y
+
+
+def measure_life106(fp: TextIO) -> tuple[int, int]:
+    """Return the height and width of a Life 1.06 file, only the bounds of the cells are kept."""
+    top = left = bottom = right = None
+    for x, y in life106_cells(fp):
+        if top is None:
+            top, left, bottom, right = y, x, y, x
+        top, left, bottom, right = min(top, y), min(left, x), max(bottom, y), max(right, x)
+    if top is None:
+        return 0, 0
+    return bottom - top + 1, right - left + 1
+
+
+def read_life106(fp: TextIO) -> Iterator[list[bool]]:
+    """Read a Life 1.06 file, every line holds the x and y coordinate of a live cell.
+
+    The coordinates are unordered, so the live cells (but never any dead ones)
+    are collected before the rows can be built.
+    """
+    live: dict[int, list[int]] = {}
+    for x, y in life106_cells(fp):
+        live.setdefault(y, []).append(x)
+
+    if not live:
+        return
+    # Coordinates can be negative, move the pattern to the top left corner
+    min_x = min(min(xs) for xs in live.values())
+    width = max(max(xs) for xs in live.values()) - min_x + 1
+
+    for y in range(min(live), max(live) + 1):
+        row = [False] * width
+        for x in live.get(y, ()):
+            row[x - min_x] = True
+        yield row
+
+
+# Reader for every supported file extension, .gol files come first
+READERS: dict[str, Callable[[TextIO], Iterator[list[bool]]]] = {
+    ".gol": read_gol,
+    ".rle": read_rle,
+    ".cells": read_cells,
+    ".lif": read_life106,
+    ".life": read_life106,
+}
+# Height and width of a file of every extension, without building its rows
+MEASURES: dict[str, Callable[[TextIO], tuple[int, int]]] = {
+    ".gol": measure_gol,
+    ".rle": measure_rle,
+    ".cells": measure_cells,
+    ".lif": measure_life106,
+    ".life": measure_life106,
+}
+PATTERN_EXTENSIONS: tuple = (*READERS, ".golb")
+
+
+class PatternStream:
+    """Rows of a pattern file, read from the disk each time the stream is iterated.
+
+    Engines accept a stream in place of a list[list[bool]] board, so the
+    board is built directly in the representation of the engine.
+    All rows are padded with dead cells to the width of the pattern.
+    The rule of the pattern is empty if the file doesn't specify one.
+
+    Only the size is read when the stream is created (from the header of a
+    .rle file). The cells are checked while the rows are read, so an
+    invalid file raises FileInvalidError while the engine is built.
+    """
+    def __init__(self, path: str):
+        self.path: str = path
+        extension = os.path.splitext(path)[1].lower()
+        self.reader = READERS[extension]
+        self.rule: str = ""
+        with open(path, "r", encoding="utf-8") as fp:
+            if self.reader is read_rle:
+                self.rule = read_rle_rule(fp)
+                fp.seek(0)
+            self.height, self.width = MEASURES[extension](fp)
+
+        if self.height == 0 or self.width == 0:
+            raise FileInvalidError("The file doesn't contain any cells.")
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __iter__(self) -> Iterator[list[bool]]:
+        rows = 0
+        with open(self.path, "r", encoding="utf-8") as fp:
+            for row in self.reader(fp):
+                if len(row) > self.width or rows == self.height:
+                    raise FileInvalidError("The file changed while it was read.")
+                rows += 1
+                yield row + [False] * (self.width - len(row))
+        if rows != self.height:
+            raise FileInvalidError("The file changed while it was read.")
+
+    def packed_rows(self) -> Iterator[int]:
+        """Iterate over the rows packed with pack_row()."""
+        return (pack_row(row) for row in self)
+
+
+# Magic, version, height, width, generation and checksum of everything after the header
+BINARY_HEADER = struct.Struct("<4sB3xIIQ8s")
+# Length of the rule, which follows the header in B/S notation, before the cells
+BINARY_RULE_LENGTH = struct.Struct("<H")
+BINARY_MAGIC: bytes = b"GOLB"
+BINARY_VERSION: int = 1
+
+
+def write_binary(path: str, rows: Iterable[int], height: int, width: int,
+                 generation: int = 0, rule: str = "") -> None:
+    """Save packed rows (see pack_row()) and their rule as a .golb file.
+
+    Every row takes (width + 7) // 8 bytes, lowest bit first.
+    The file is replaced in one step, so a checkpoint is never left half written.
+    """
+    row_bytes = (width + 7) // 8
+    rule_bytes = rule.encode("ascii")
+    data = (BINARY_RULE_LENGTH.pack(len(rule_bytes)) + rule_bytes
+            + b"".join(row.to_bytes(row_bytes, "little") for row in rows))
+    checksum = blake2b(data, digest_size=8).digest()
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as fp:
+        fp.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, height, width,
+                                    generation, checksum))
+        fp.write(data)
+    os.replace(temp_path, path)
+
+
+class BinaryPattern(PatternStream):
+    """Rows of a .golb file, read from a memory map of the file.
+
+    The generation the board was saved at is available as generation,
+    so a checkpoint can be resumed with the right generation count, and
+    the rule it was simulated with as rule.
+    """
+    def __init__(self, path: str):  # pylint: disable=super-init-not-called
+        self.path: str = path
+        with open(path, "rb") as fp:
+            header = fp.read(BINARY_HEADER.size + BINARY_RULE_LENGTH.size)
+            if len(header) < BINARY_HEADER.size:
+                raise FileInvalidError("The .golb file is too short to be a board.")
+            magic, version, self.height, self.width, self.generation, checksum \
+                = BINARY_HEADER.unpack_from(header)
+            if magic != BINARY_MAGIC:
+                raise FileInvalidError("The file isn't a .golb file.")
+            if version != BINARY_VERSION:
+                raise FileInvalidError(f"The .golb file has version {version}, "
+                                       f"only version {BINARY_VERSION} can be loaded.")
+            if len(header) < BINARY_HEADER.size + BINARY_RULE_LENGTH.size:
+                raise FileInvalidError("The .golb file is too short to be a board.")
+
+            # The cells start after the rule
+            rule_length = BINARY_RULE_LENGTH.unpack_from(header, BINARY_HEADER.size)[0]
+            self.offset: int = len(header) + rule_length
+            self.row_bytes: int = (self.width + 7) // 8
+            if (self.height == 0 or self.width == 0
+                    or os.fstat(fp.fileno()).st_size != self.offset + self.height * self.row_bytes):
+                raise FileInvalidError("The size of the .golb file doesn't match its header.")
+
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as cells:
+                # Hashed straight from the page cache, without copying the cells
+                with memoryview(cells) as view:
+                    if blake2b(view[BINARY_HEADER.size:], digest_size=8).digest() != checksum:
+                        raise FileInvalidError("The .golb file is damaged, its checksum doesn't match.")
+                self.rule: str = cells[len(header):self.offset].decode("ascii", "replace")
+
+    def __iter__(self) -> Iterator[list[bool]]:
+        return (unpack_row(packed, self.width) for packed in self.packed_rows())
+
+    def packed_rows(self) -> Iterator[int]:
+        with open(self.path, "rb") as fp, \
+                mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as cells:
+            for start in range(self.offset, len(cells), self.row_bytes):
+                yield int.from_bytes(cells[start:start + self.row_bytes], "little")
+
+
+def open_pattern(path: str) -> PatternStream:
+    """Return the stream for a pattern file of any supported format."""
+    if os.path.splitext(path)[1].lower() == ".golb":
+        return BinaryPattern(path)
+    return PatternStream(path)
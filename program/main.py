@@ -1,8 +1,8 @@
 """Python terminal implementation of John Conway's Game of Life."""
 import sys
 import os
-import random
-from time import sleep
+import atexit
+from time import sleep, perf_counter
 try:
     # msvcrt is Windows-only
     import msvcrt
@@ -15,28 +15,30 @@ try:
     # colorama needs to be installed separately
     from colorama import Back, Fore
 except ImportError:
+    if __name__ != "__main__":
+        # Programs that import this module handle the error themselves
+        raise
     print("Error importing modules. Please run setup.py from a windows environment."
           "Also chceck if your Python version supports the msvcrt module.\n")
     sys.exit(1)
 
-
-class FileInvalidError(Exception):
-    """Custom error for .gol files that don't pass the validity check."""
-    def __init__(
-        self,
-        message="File didn't pass the validity check. "
-        "All characters must be printable and all lines must have the same length."):
-        self.message = message
-        super().__init__(self.message)
-
-
-def set_dir_and_os() -> None:
-    """Set the starting directory and check that the program is run on Windows.
-
-    Latter is due to the fact that the program can only run on windows.
-    """
-    # Set working directory to the program directory
-    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+from loaders import FileInvalidError, PatternStream, write_binary
+from engines import ENGINES, NUMPY_ERR, Engine, ParallelEngine
+from cycles import CycleDetector
+from board_files import (BOARDS_PATH, CATALOG, FAVOURITES_PATH, add_extension, check_origin,
+                         ensure_folders, export_to_file, gol_filename, import_from_file,
+                         manually_create_level, number_filename)
+from renderer import DiffRenderer
+from pipeline import FrameScheduler, SimulationWorker
+from viewport import ZOOM_LEVELS, Viewport, cells_on_screen
+from rules import CONWAY, RULES, Rule
+from profiler import Profiler
+from soups import generate_random_board, terminal_area
+from history import History
+from objects import describe_objects, find_objects
+
+# Largest bounding box of an unbounded board that is searched for objects, 8 MB of rows
+CENSUS_CELLS: int = 1 << 26
 
 
 def clear() -> None:
@@ -44,20 +46,26 @@ def clear() -> None:
     os.system("cls" if os.name == "nt" else "clear")
 
 
-def check_origin(filename: str) -> str:
-    """Check boards and favourites folder.
-
-    Return the location of the file, or None if it doesn't exist.
-    """
-    return BOARDS_PATH if filename in os.listdir(BOARDS_PATH) \
-    else FAVOURITES_PATH if filename in os.listdir(FAVOURITES_PATH) \
-    else None
+def print_boards(folder: str) -> None:
+    """Print the boards of a folder with their size and population."""
+    boards = CATALOG.names(folder)
+    if not boards:
+        print("[Empty]")
+    for board in boards:
+        entry = CATALOG.info(board, folder)
+        if entry is None:
+            # Deleted in the meantime
+            continue
+        details = entry["error"] if "error" in entry \
+            else f"{entry['width']}x{entry['height']}, {entry['population']} live cells"
+        print(f"{board} {Fore.LIGHTBLACK_EX}({details}){Fore.RESET}")
 
 
-def handle_special_args() -> str:
+def handle_special_args() -> dict:
     """Handle special args that start with a hyphen (-)
 
-    Return the background character for the board or exit the program directly.
+    Return the settings for the simulation (background character, timeout, engine
+    and generation to jump to) or exit the program directly.
 
     Other arguments will only be taken into account if the
     first argument is valid.
@@ -74,22 +82,40 @@ def handle_special_args() -> str:
     -d to delete the file, even if it is in the favourites folder.
     -c to select the character used for the board background.
         The -c arg is placed after the filename of a .gol board, if specified.
-    -t to select the time to sleep inbetween printing boards. Default is 0.25 s.
+    -t to select the time between two frames. Default is 0.25 s.
+    -m to select the engine that calculates the generations. Default is "list".
+    -j to jump to the specified generation before displaying the board.
+    -w to select the number of worker processes for the parallel engine.
+        Default is the number of CPU cores.
+    -b to run the specified number of generations in headless mode, without rendering.
+    -o to save the final board of a headless run to the specified .gol file.
+    -k to save a checkpoint of the board every specified number of generations.
+    -z to select the zoom level of the viewport. Default is "cells".
+    -r to select the rule in B/S notation. Default is the rule of the file or B3/S23.
+    -i to time every phase of each generation and save the trace to the specified file.
+    -s to select the seed of the random board, the same seed gives the same board.
+    -p to select the density of live cells of the random board. Default is 0.5.
+    -u to select the memory used for the history of past generations in MB. Default is 16.
+    -g to select the generation to go back to at the end of a headless run.
     """
-    # Setup default values for -c and -t args
-    board_filler, timeout = " ", 0.25
+    # Setup default values for -c, -t, -m, -j, -w, -b, -o, -k, -z, -r, -i, -s, -p, -u and -g args
+    settings = {"filler": " ", "timeout": 0.25, "engine": "list", "jump": 0, "workers": 0,
+                "headless": 0, "output": "", "checkpoint": 0, "zoom": "cells", "rule": "",
+                "profile": "", "seed": None, "density": 0.5, "history": 16.0, "seek": -1}
     if len(sys.argv) == 1:
         # No args to handle, return default values
-        return board_filler, timeout
+        return settings
     arg1 = sys.argv[1]
     finish = False
 
     if arg1 == "-h":  # Help
-        print("""
+        print(f"""
 Usage: py main.py [args]
 
 The first argument is either ONLY a filename (with or without extension)
-of a .gol board, or a special argument.
+of a board, or a special argument.
+Boards can be .gol files, run length encoded .rle files, plaintext .cells files
+or Life 1.06 (.lif, .life) files from the boards or favourites folder.
 A second argument will only be taken into account if paired with a valid special argument.
 
 Special args can be the following:
@@ -105,38 +131,98 @@ Special args can be the following:
 -c to select the character that fills the board as background.
     The -c argument is to be placed AFTER the name of a .gol board, if specified.
 -t to select the amount of seconds between two generations. Default is 0.25 seconds.
-    Keep in mind that the actual
-    speed of generations still depends on the performance of your computer, especially
-    for big boards.""")
+    Generations are computed ahead in the background. If drawing can't keep up, frames
+    are skipped to stay on time. If computing can't keep up (big boards on a slow
+    computer), the simulation runs as fast as it can.
+-m to select the engine that calculates the generations. Default is "list".
+    Available engines: {", ".join(ENGINES)}
+    The "tiled" engine only recomputes the parts of the board that can change.
+    The "numpy" engine is a lot faster for big boards, but needs NumPy to be installed.
+    The "bits" engine is also a lot faster than "list" and works without NumPy. Once
+    the board settles, it only recomputes the rows next to the rows that changed.
+    The "table" engine advances 2x2 blocks of cells using a precomputed lookup table,
+    which is built once and cached in the .cache folder. It's experimental and slower
+    than "bits", use "bits" unless you want to compare the two.
+    The "sparse" engine is the fastest for big boards with only a few live cells.
+    The "chunked" engine simulates an UNBOUNDED board as well: the world grows in chunks
+    of 64x64 cells wherever live cells go, e.g. the gliders of a glider gun fly on forever.
+    The "hashlife" engine simulates an UNBOUNDED board (the board you see is only a window
+    into it) and is by far the fastest for jumping far ahead with -j.
+-j [generation] to jump to the specified generation before displaying the board.
+    Powers of two can be written as 2^k, e.g. -j 2^20.
+    Use it together with -m hashlife to jump millions of generations ahead.
+-w [workers] to select the number of worker processes used by the "parallel" engine.
+    Default is the number of CPU cores of your computer. The parallel engine only
+    pays off for very big boards.
+-b [generations] to run the specified number of generations in headless mode.
+    Nothing is drawn and there are no pauses, at the end the final population and the
+    speed in generations per second are printed. Meant for scheduled jobs, e.g.
+    "py main.py glider_gun -m bits -b 100000".
+-o [filename] to save the final board of a headless run (-b) as a .gol file.
+-k [generations] to save a checkpoint every specified number of generations.
+    Checkpoints are compact binary .golb files in the boards folder, named after the
+    board (or "random.golb"). To resume, start the checkpoint like any other board with
+    the extension, e.g. "py main.py glider_gun.golb", the generation count and the rule continue.
+-z [zoom] to select how many cells are packed into one character. Default is "cells".
+    Zoom levels: {", ".join(ZOOM_LEVELS)}
+    "half" draws 2 cells per character using half blocks, "braille" 8 cells using
+    braille dots, "braille2" to "braille8" merge 2x2 to 8x8 cells into one dot.
+    Boards bigger than the terminal only show the part that fits on the screen.
+    While the simulation runs, use [W] [A] [S] [D] to move the viewport and [+] [-] to
+    zoom in and out (Windows only, like [Enter]). Random boards fill the screen at the
+    selected zoom level.
+-r [rule] to select the rule of the simulation in B/S notation. Default is Conway's B3/S23,
+    or the rule in the header of a .rle file. E.g. "-r B36/S23" is HighLife: cells are also
+    born with 6 neighbours. Known rules can be selected by name: {", ".join(RULES)}
+-i [filename] to measure how long each phase of every generation takes (computing, checks,
+    capturing, checkpoints, waiting, drawing and input), together with the population and
+    the number of cells that changed. The averages are shown below the status line. If the
+    filename ends with .csv, every generation is written to it while the game runs,
+    otherwise the last 4096 generations and the total times are saved at exit as JSON.
+    E.g. "py main.py glider_gun -m bits -b 10000 -i trace.csv".
+-s [seed] to select the seed of the random board. The seed of every random board is shown
+    at the end, start the game with the same seed (and size) to get the same board again.
+-p [density] to select the share of live cells of the random board, from 0 to 1.
+    Default is 0.5. E.g. "py main.py -p 0.3 -s 42".
+-u [megabytes] to select how much memory the history of past generations may use.
+    Default is 16 MB, 0 turns the history off. The history stores a full board every 64
+    generations and only the changes in between, the oldest generations are dropped once
+    it's full. While the simulation runs, press [,] to pause and go back a generation and
+    [.] to go forward again (Windows only, like [Enter]). Going forward past the latest
+    generation continues the simulation.
+-g [generation] to go back to an earlier generation at the end of a headless run (-b).
+    Its population is printed and -o saves this generation instead of the last one.
+    E.g. "py main.py glider_gun -m bits -b 1000 -g 500 -o gun_500".""")
         sys.exit(0)
 
     if arg1 == "-l":  # List
-        boards: list[str] = os.listdir(BOARDS_PATH)
-        boards.sort()
-
+        # Sizes and populations come from the catalog, only changed boards are read
         print(f"Saved boards:\n{Fore.LIGHTBLUE_EX}")
-        print("\n".join(boards) if len(boards) > 0 else "[Empty]")
+        print_boards(BOARDS_PATH)
         # Show absolute path of boards folder for easy access
         print(f"{Fore.RESET}\n{Fore.LIGHTBLACK_EX}"
               f"Your boards are saved here: {BOARDS_PATH}"
               f"{Fore.RESET}\n\n")
 
-        boards: list[str] = os.listdir(FAVOURITES_PATH)
-        boards.sort()
-
         print(f"Favourites:\n{Fore.LIGHTCYAN_EX}")
-        print("\n".join(boards) if len(boards) > 0 else "[Empty]")
+        print_boards(FAVOURITES_PATH)
         # Show absolute path of boards folder for easy access
         print(f"{Fore.RESET}\n{Fore.LIGHTBLACK_EX}"
               f"Your favourites are saved here: {FAVOURITES_PATH}"
               f"{Fore.RESET}")
 
+        duplicates = CATALOG.duplicates()
+        if duplicates:
+            print(f"\n{Fore.YELLOW}Identical boards:{Fore.RESET}")
+            for names in duplicates:
+                print(" = ".join(names))
+
         sys.exit(0)
 
     if arg1 == "-e":  # Erase
         if input("Are you sure you want to DELETE all of your saved boards?\n"
                  "Favourites will not be affected. [y/n] ").lower() == "y":
-            for file in os.listdir(BOARDS_PATH):
+            for file in CATALOG.names(BOARDS_PATH):
                 # Remove each file but leave the folder
                 os.remove(os.path.join(BOARDS_PATH, file))
 
@@ -144,7 +230,7 @@ Special args can be the following:
         sys.exit(0)
 
     if arg1 == "-f" and len(sys.argv) > 2:  # Favourite
-        fav_file = f"{sys.argv[2]}{'.gol' if sys.argv[2][-4:] != '.gol' else ''}"
+        fav_file = add_extension(sys.argv[2])
 
         if check_origin(fav_file) == BOARDS_PATH:
             # File is there, ready to move to favourites
@@ -199,7 +285,7 @@ Special args can be the following:
         elif origin == FAVOURITES_PATH:
             # File exists already in favourites folder
             print(f"A file called \"{overwrite_file}\" already exists in your favourites.")
-            overwrite_file = overwrite_file[:-4] + "(1)" + overwrite_file[-4:]  # Add (1) to name
+            overwrite_file = number_filename(overwrite_file)  # Add (1) to name
             print(f"A file called \"{overwrite_file}\" will be created instead.")
 
             manually_create_level(overwrite_file)
@@ -212,7 +298,7 @@ Special args can be the following:
 
     if arg1 == "-d" and len(sys.argv) > 2:  # Delete
         # Set the name of the file to delete
-        file_to_delete = f"{sys.argv[2]}{'.gol' if sys.argv[2][-4:] != '.gol' else ''}"
+        file_to_delete = add_extension(sys.argv[2])
         try:
             os.remove(os.path.join(check_origin(file_to_delete), file_to_delete))
             print(f"{Fore.GREEN}SUCCESS: {Fore.RESET}File deleted successfully.")
@@ -231,12 +317,139 @@ Special args can be the following:
         while len(board_filler) != 1:
             board_filler = input("Exactly ONE character can fill the board. Enter new character: ")
 
+        settings["filler"] = board_filler
+
     if len(sys.argv) > 2 and any(arg == "-t" for arg in sys.argv):  # Time
         timeout = sys.argv[sys.argv.index("-t") + 1]
         while not timeout.replace(".", "", 1).isdigit():
             timeout = input("Enter a float or int as a board timeout: ")
 
-        timeout = float(timeout)
+        settings["timeout"] = float(timeout)
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-m" for arg in sys.argv):  # Engine
+        engine = sys.argv[sys.argv.index("-m") + 1]
+        while engine not in ENGINES:
+            engine = input(f"Available engines are {', '.join(ENGINES)}. Enter engine: ")
+
+        if engine == "numpy" and NUMPY_ERR:
+            print(f"{Fore.RED}ERROR: {Fore.RESET}"
+                  "The numpy engine needs NumPy. Install it using \"pip install numpy\".")
+            sys.exit(1)
+
+        settings["engine"] = engine
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-j" for arg in sys.argv):  # Jump
+        jump = sys.argv[sys.argv.index("-j") + 1]
+        # Also accept powers of two like 2^20
+        while not jump.removeprefix("2^").isdigit():
+            jump = input("Enter the generation to jump to (e.g. 1000 or 2^20): ")
+
+        settings["jump"] = 2 ** int(jump[2:]) if jump.startswith("2^") else int(jump)
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-w" for arg in sys.argv):  # Workers
+        workers = sys.argv[sys.argv.index("-w") + 1]
+        while not workers.isdigit() or int(workers) < 1:
+            workers = input("Enter the number of worker processes (at least 1): ")
+
+        settings["workers"] = int(workers)
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-b" for arg in sys.argv):  # Batch (headless)
+        headless = sys.argv[sys.argv.index("-b") + 1]
+        if not headless.isdigit() or int(headless) < 1:
+            # No input() in headless mode, it's meant to run without a user
+            print(f"{Fore.RED}ERROR: {Fore.RESET}"
+                  "-b needs the number of generations to run, e.g. -b 100000.")
+            sys.exit(1)
+
+        settings["headless"] = int(headless)
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-o" for arg in sys.argv):  # Output
+        settings["output"] = gol_filename(sys.argv[sys.argv.index("-o") + 1])
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-k" for arg in sys.argv):  # Checkpoints
+        checkpoint = sys.argv[sys.argv.index("-k") + 1]
+        if not checkpoint.isdigit() or int(checkpoint) < 1:
+            print(f"{Fore.RED}ERROR: {Fore.RESET}"
+                  "-k needs the number of generations between checkpoints, e.g. -k 1000.")
+            sys.exit(1)
+
+        settings["checkpoint"] = int(checkpoint)
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-z" for arg in sys.argv):  # Zoom
+        zoom = sys.argv[sys.argv.index("-z") + 1]
+        while zoom not in ZOOM_LEVELS:
+            zoom = input(f"Available zoom levels are {', '.join(ZOOM_LEVELS)}. Enter zoom level: ")
+
+        settings["zoom"] = zoom
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-r" for arg in sys.argv):  # Rule
+        rule = sys.argv[sys.argv.index("-r") + 1]
+        while True:
+            try:
+                # Only checked here, engines get the Rule object later
+                Rule(rule)
+                break
+            except ValueError as ex:
+                rule = input(f"{ex} Enter rule (e.g. B36/S23): ")
+
+        settings["rule"] = rule
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-i" for arg in sys.argv):  # Instrumentation
+        index = sys.argv.index("-i") + 1
+        profile = sys.argv[index] if index < len(sys.argv) else ""
+        if not profile or profile.startswith("-"):
+            print(f"{Fore.RED}ERROR: {Fore.RESET}"
+                  "-i needs the file to save the trace to, e.g. -i trace.json.")
+            sys.exit(1)
+
+        settings["profile"] = profile
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-s" for arg in sys.argv):  # Seed
+        seed = sys.argv[sys.argv.index("-s") + 1]
+        while not seed.isdigit():
+            seed = input("Enter the seed of the random board (a whole number): ")
+
+        settings["seed"] = int(seed)
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-p" for arg in sys.argv):  # Density
+        density = sys.argv[sys.argv.index("-p") + 1]
+        while not density.replace(".", "", 1).isdigit() or float(density) > 1:
+            density = input("Enter the density of live cells, from 0 to 1 (e.g. 0.3): ")
+
+        settings["density"] = float(density)
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-u" for arg in sys.argv):  # History memory
+        history = sys.argv[sys.argv.index("-u") + 1]
+        while not history.replace(".", "", 1).isdigit():
+            history = input("Enter the memory for the history in MB (0 turns it off): ")
+
+        settings["history"] = float(history)
+        finish = True
+
+    if len(sys.argv) > 2 and any(arg == "-g" for arg in sys.argv):  # Go to generation
+        seek = sys.argv[sys.argv.index("-g") + 1]
+        if not seek.isdigit() or "-b" not in sys.argv:
+            print(f"{Fore.RED}ERROR: {Fore.RESET}"
+                  "-g needs the generation to go back to and a headless run, e.g. -b 1000 -g 500.")
+            sys.exit(1)
+        if not settings["history"]:
+            print(f"{Fore.RED}ERROR: {Fore.RESET}"
+                  "-g needs the history, it can't be used together with -u 0.")
+            sys.exit(1)
+
+        settings["seek"] = int(seek)
         finish = True
 
     if sys.argv[1][0] == "-" and not finish:  # Invalid
@@ -244,7 +457,7 @@ Special args can be the following:
               "Invalid argument. Filenames cannot start with a hyphen. See -h for help.")
         sys.exit(1)
 
-    return board_filler, timeout  # Default filler, default interval
+    return settings
 
 
 def display_welcome() -> None:
@@ -297,8 +510,14 @@ Try to pinch to zoom out for more cells in the simulation when using an auto-gen
     clear()
 
 
-def get_start_board() -> list[list[bool]]:
-    """Handle and return a board based on the command line arguments."""
+def get_start_board(headless: bool = False, size: tuple[int, int] = (-1, -1),
+                    density: float = 0.5, seed: int | None = None) -> list[list[bool]] | PatternStream:
+    """Handle and return a board based on the command line arguments.
+
+    In headless mode, errors exit the program directly instead of asking the user.
+    Random boards have the specified size (height, width), default is the terminal size,
+    as well as the specified density and seed.
+    """
     # Get filename to import from command line args, avoiding special args
     filename: str = sys.argv[1] if len(sys.argv) > 1 and "-" not in sys.argv[1] else ""
 
@@ -309,6 +528,10 @@ def get_start_board() -> list[list[bool]]:
 
         except TypeError:
             # File doesn't exist
+            if headless:
+                print(f"{Fore.RED}ERROR: {Fore.RESET}File \"{filename}\" could not be found.")
+                sys.exit(1)
+
             if input(f"{Fore.RED}ERROR:{Fore.RESET} Your file was not found.\n"
                      "Do you want to start the level editor to make your own board? [y/n] "
                      ).lower() == "y":
@@ -317,297 +540,181 @@ def get_start_board() -> list[list[bool]]:
 
             else: sys.exit(0)
 
-        except FileInvalidError:
-            print(f"{Fore.RED}ERROR: {Fore.RESET}File invalid. Try again with another file.")
-            if input("Would you like to delete the corrupted file? [y/n] ").lower() == "y":
-                # Delete invalid file
-                filename = add_extension(filename)
-                # Look in both the boards and the favourites folder
-                os.remove(os.path.join(check_origin(filename), filename))
-                print(f"{Fore.GREEN}SUCCESS: {Fore.RESET}{filename} deleted successfully")
-
-            sys.exit(1)
+        except FileInvalidError as ex:
+            invalid_file(ex, filename, headless)
 
     else:
         # No args, full terminal boards will be created
-        local_board = generate_random_board()
+        local_board = generate_random_board(*size, density, seed)
 
     return local_board
 
 
-def controlled_input(input_string: str, max_len: int) -> list[str]:
-    """Input function but with max length
-
-    Automatically returns and goes on to the next line when the specified
-    input length has been reached.
-    Still allows for Ctrl+C to interrupt the program.
-    This function was written with the help of ChatGPT.
+def invalid_file(ex: FileInvalidError, filename: str, headless: bool = False) -> None:
+    """Tell the user that the board file is invalid, offer to delete it and exit the program.
 
-    WARNING: This only works on Windows devices.
+    Files are checked while the engine reads them, so this happens either
+    when the file is opened or when the engine is built.
     """
-    input_chars: list[str] = []
-    print(input_string, end="", flush=True)
-
-    while True:
-        if msvcrt.kbhit():  # React to keyboard input
-            # Get typed character from keyboard and decode it
-            char = msvcrt.getwch()
-            # Handle all exceptions and special keys
-            if char == "\x03":  # Ctrl+C
-                # Simulate same behaviour of "regular" Ctrl+C
-                raise KeyboardInterrupt
-
-            if char == "\x08":  # Backspace key
-                if input_chars:
-                    input_chars.pop()
-                    # Move cursor back, overwrite character with a space
-                    print("\b \b", end="", flush=True)
-                continue
-
-            if char == "\r":  # Enter key
-                # Function returns automatically
-                continue
-
-            # Add typed character to list and print it to the screen
-            input_chars.append(char)
-            print(char, end="", flush=True)
-
-            if len(input_chars) >= max_len:
-                # Desired length reached
-                break
-
-    print()
-    return input_chars
-
-
-def generate_random_board(height: int = -1, width: int = -1) -> list[list[bool]]:
-    """Generates a random starting configuration of a board.
+    print(f"{Fore.RED}ERROR: {Fore.RESET}File invalid. {ex.message} Try again with another file.")
+    if not headless and input("Would you like to delete the corrupted file? [y/n] ").lower() == "y":
+        # Delete invalid file
+        filename = add_extension(filename)
+        # Look in both the boards and the favourites folder
+        os.remove(os.path.join(check_origin(filename), filename))
+        print(f"{Fore.GREEN}SUCCESS: {Fore.RESET}{filename} deleted successfully")
 
-    Arguments specify the size of the board.
-    A cell has a 50% chance to contain a counter.
-
-    If the args are -1 for both height and width, the numbers will be
-    selected so that the game consumes the entire screen.
-    """
-    local_board: list[list[bool]] = []
-
-    if (height, width) == (-1, -1):
-        # Fill the entire screen
-        terminal = os.get_terminal_size()
-        # Terminal rendering doesn't like fullscreen, make place for generation count
-        height = terminal.lines - 3
-        # One cell is 2 chars wide, make place for separator
-        width = terminal.columns // 2 - 1
-
-    for _ in range(height):
-        # Generate a line of bools
-        generated_line = [(random.random() <= 0.5) for _ in range(width)]
-        local_board.append(generated_line)
-
-    return local_board
-
-
-def import_from_file(filepath: str) -> list[list[bool]]:
-    """Turns a file into a proper list and checks the validity of the board."""
-    local_board: list[list[bool]] = []
-    line: str = "PLACEHOLDER"
-
-    # Add file extension if it wasn't provided
-    filepath = add_extension(filepath)
-
-    with open(os.path.join(check_origin(filepath), filepath), "r", encoding="utf-8") as fp:
-        print(f"{Fore.GREEN}SUCCESS: {Fore.RESET}File found, initializing...")
-        sleep(1.2)
-
-        while line:
-            line = fp.readline().strip("\n")
-            # Convert char to bool value
-            processed_line = [not char == " " for char in line]
-            if processed_line:
-                # Avoids empty lists, they exist for some reason
-                local_board.append(processed_line)
+    sys.exit(1)
 
-    if check_validity(local_board):
-        return local_board
 
-    # File is faulty
-    raise FileInvalidError
+def checkpoint_filename() -> str:
+    """Return the name of the .golb checkpoint file for the board of this run."""
+    filename = sys.argv[1] if len(sys.argv) > 1 and "-" not in sys.argv[1] else "random"
+    return os.path.splitext(add_extension(filename))[0] + ".golb"
 
 
-def check_validity(board: list[list[bool]]) -> bool:
-    """Check if the formatting is valid in a starting configuration file.
+def save_checkpoint(engine: Engine, generation: int, filename: str) -> None:
+    """Save the board of the engine as a binary checkpoint in the boards folder.
 
-    Count the different lengths of rows on a board.
-    All rows should be the same length.
+    The generation and the rule are stored in the file, so resuming continues
+    the generation count with the same rule.
     """
-    last_col = -1
-    diff_cols = 0
-    for _, col in enumerate(board[:-1]):
-        curr_col = len(col)
-
-        if curr_col != last_col:
-            diff_cols += 1
-
-        last_col = curr_col
-
-    return diff_cols == 1
-
-
-def add_extension(filename: str) -> str:
-    """Add the .gol extension to a file if not present already."""
-    return filename + (".gol" if filename[-4:] != ".gol" else "")
-
-
-def manually_create_level(filename: str="") -> list[list[bool]]:
-    """Create a level according to user specifications.
-
-    The new level will be saved in a .gol file as characters.
-    Print a success message at the end if all worked well.
+    write_binary(os.path.join(BOARDS_PATH, filename), engine.packed_rows(),
+                 engine.height, engine.width, generation, engine.rule.name)
+
+
+def run_headless(engine: Engine, generations: int, detector: CycleDetector,
+                 start: int = 0, output: str = "", checkpoint: int = 0,
+                 profiler: Profiler | None = None, history: History | None = None,
+                 seek: int = -1) -> None:
+    """Run the specified amount of generations without rendering, then exit the program.
+
+    Stops early if the board dies out, only consists of still lives or oscillates.
+    Print the final population and the speed in generations per second.
+    Every checkpoint generations (if not 0), the board is saved as a checkpoint.
+    The phases of every generation are timed by the profiler, if it is enabled.
+    Every generation is recorded in the history (if there is one), so that the
+    run can go back to the seek generation at the end.
     """
-    if MSVCRT_ERR:
-        # Invalid OS or python version
-        print(f"""
-{Fore.RED}FATAL ERROR{Fore.RESET}
-This part of the program cannot be accessed either due to an invalid Python version
-or not running the game on a Windows environment.
-
-Please restart the game either on a Windows device
-or using Python 3.12 or 3.11 (the game is tested for those versions).""")
-        sys.exit(1)
-
-    local_board: list[list[str]] = []
-    filename = add_extension(filename)
-
-    with open(os.path.join(BOARDS_PATH, filename), "w", encoding="utf-8") as fp:
-        if check_origin(filename) == FAVOURITES_PATH:
-            print(f"A file called \"{filename}\" is already in your favourites.")
-            filename = filename[:-4] + "(1)" + filename[-4:]  # Add ending (1) to filename
-            print(f"A file called \"{filename}\" will be created instead.")
-
-        print()
-        # Get parameters for the board from the user
-        while True:
-            width: str = input("Enter board width (cells): ")
-            if not width.isnumeric() or int(width) <= 1:
-                print("Minimum value is 2. Please only write numbers\n")
-                continue
-
-            height: str = input("Enter board height (cells): ")
-            if not height.isnumeric() or int(height) <= 1:
-                print("Minimum value is 2. Please only write numbers\n")
-                continue
-
-            height, width = int(height), int(width)
+    profiler = profiler or Profiler(enabled=False)
+    generation = start
+    profiler.count(start, engine)
+    if history is not None:
+        history.record(start, engine.packed_rows())
+    start_time = perf_counter()
+
+    for generation in range(start + 1, start + generations + 1):
+        with profiler.phase(generation, "step"):
+            changed = engine.step()
+        profiler.count(generation, engine)
+        if history is not None:
+            with profiler.phase(generation, "history"):
+                stats = engine.stats
+                if stats is None:
+                    history.record(generation, engine.packed_rows())
+                else:
+                    # Only the rows that changed are read
+                    history.record(generation, stats.rows, stats.dirty)
+        with profiler.phase(generation, "checks"):
+            if not changed:
+                reason = "The board only consists of still lives."
+            elif engine.population() == 0:
+                reason = "The board died out."
+            elif detector.check(engine.fingerprint(), generation):
+                reason = detector.describe()
+            else:
+                reason = ""
+        if reason:
             break
+        if checkpoint and generation % checkpoint == 0:
+            with profiler.phase(generation, "checkpoint"):
+                save_checkpoint(engine, generation, checkpoint_filename())
+    else:
+        reason = f"Finished {generations} generations."
+
+    elapsed = perf_counter() - start_time
+    calculated = generation - start
+
+    print(reason)
+    if engine.rule != CONWAY:
+        print(f"Rule: {engine.rule.name}")
+    print(f"Generation: {generation}")
+    print(f"Population: {engine.population()}")
+    box = engine.bounding_box()
+    if box:
+        top, left, bottom, right = box
+        outside = top < 0 or left < 0 or bottom >= engine.height or right >= engine.width
+        # Unbounded engines can have live cells outside of the board, even at negative positions
+        print(f"Bounding box: {right - left + 1}x{bottom - top + 1} cells, "
+              f"rows {top + 1} to {bottom + 1}, columns {left + 1} to {right + 1}"
+              + (", beyond the edges of the board" if outside else ""))
+    if engine.rule == CONWAY:
+        print(live_census(engine))
+    print(f"Speed: {calculated / elapsed if elapsed else 0:.1f} generations per second "
+          f"({calculated} generations in {elapsed:.3f} seconds)")
+    if engine.info():
+        print(engine.info())
+    if profiler.enabled:
+        print(profiler.summary())
+    if checkpoint and generation >= checkpoint:
+        last = generation - generation % checkpoint
+        print(f"Last checkpoint: generation {last} in \"{checkpoint_filename()}\"")
+
+    final_board = engine.to_board() if output else []
+    if history is not None:
+        print(f"History: generations {history.first}-{history.last}, "
+              f"{history.size / 2 ** 20:.1f} of {history.budget / 2 ** 20:.3g} MB used")
+        if seek in history:
+            snapshot = history.snapshot(seek)
+            print(f"Generation {seek}: population {sum(row.bit_count() for row in snapshot.rows)}")
+            final_board = snapshot.to_board() if output else []
+        elif seek > history.last:
+            print(f"{Fore.RED}ERROR: {Fore.RESET}The run ended at generation {history.last}, "
+                  f"before generation {seek}.")
+            output = ""
+        else:
+            print(f"{Fore.RED}ERROR: {Fore.RESET}Generation {seek} isn't in the history anymore. "
+                  "Use -u to keep more generations.")
+            output = ""
 
-        print()
-        # Actually get and save input
-        for i in range(height):
-            # Format and write chars entered by user
-            line: list[str] = controlled_input(f"Enter line No. {i + 1}: ", width)
-            # Directly convert input to bool values
-            processed_input = [not char == " " for char in line]
-            local_board.append(processed_input)
-
-            fp.write("".join(line))
-            if i != height - 1:
-                # Don't write last newline
-                fp.write("\n")
-
-        print(f"\n{Fore.GREEN}SUCCESS: {Fore.RESET}File created successfully!")
-
-    return local_board
+    if output:
+        export_to_file(final_board, output)
+    sys.exit(0)
 
 
-def count_neighbors(board: list[list[bool]], row: int, col: int) -> int:
-    """Count the number of live neighbors for a given cell.
+def object_census(rows: list[int], window_only: bool = False) -> str:
+    """Return the objects left on a board of packed rows, e.g. "Objects: 3x block, 1x glider".
 
-    Iterate over relative positions of neighbour cells
-    and check the state of the counters inside.
+    Only the objects of Conway's rules are known. If the rows are only the
+    window of an unbounded board, the census says so.
     """
-    # Relative position of the cells neighbours
-    neighbour_rel_pos: list = [(row - 1, col - 1), (row - 1, col), (row - 1, col + 1),
-                               (row, col - 1),                     (row, col + 1),
-                               (row + 1, col - 1), (row + 1, col), (row + 1, col + 1),]
-
-    live_neighbors: int = 0
-    for i, j in neighbour_rel_pos:
-        #           counter is in a valid position          cell is alive
-        if (0 <= i < len(board) and 0 <= j < len(board[0])) and board[i][j]:
-            live_neighbors += 1
+    census = describe_objects(find_objects(rows))
+    return census + " (only the visible board was searched)" if window_only else census
 
-    return live_neighbors
 
+def live_census(engine: Engine) -> str:
+    """Return the objects left on the board of an engine, see object_census().
 
-def update_board(board: list[list[bool]], count: int) -> list[list[bool]]:
-    """Update the board according to the rules of the Game of Life.
-    
-    Credit to Mizipor on StackOverflow for the non-blocking input.
-    Link to the thread: https://stackoverflow.com/questions/2408560/non-blocking-console-input
+    Unbounded engines are searched within the bounding box of all live
+    cells, unless it's too big, then only the board is searched.
     """
-    # Initialize a board where all cells are dead
-    new_board: list[list[bool]] = [[False] * len(board[0]) for _ in range(len(board))]
-    live_cells = 0  # To check if entire board is dead
-
-    for i, _ in enumerate(board):
-        for j, counter in enumerate(board[i]):
-            live_neighbors = count_neighbors(board, i, j)
-
-            # Apply Game of Life rules
-            #     live cell has 2 or 3 neighbours           cell is a birth cell -> 3 neighbours
-            if (counter and (live_neighbors in (2, 3))) or (not counter and live_neighbors == 3):
-                new_board[i][j] = True
-                live_cells += 1
-
-    if live_cells == 0:
-        # Entire board is dead, end the game with the amount of generations passed
-        end_game(count)
-
-    if not MSVCRT_ERR and msvcrt.kbhit():
-        # bkhit() check only works on Windows
-        if msvcrt.getch() == b"\r":
-            # User has pressed [Enter] to exit the game mid-simulation.
-            end_game(count)
-
-
-    return new_board
-
-
-def print_board(local_board: list[list[bool]], gen_count: int, character: str = " ") -> None:
-    """Print the current state of the board. Display the number of passed generations.
-
-    Colorama is used to draw colored characters.
-    Live cells are displayed as green.
-    The specified character is used to fill the cells, default is empty.
-
-    Screen flickering can occur, but that can't be avoided while not fundamentally
-    changing the structure of the program. This is due to how most terminal
-    applications handle output, which is line by line. When the ouput doesn't
-    happen to be synchronized with the monitor refresh rate, flickering can't be
-    avoided.
+    box = engine.bounding_box() if engine.unbounded else None
+    if box is None:
+        return object_census(engine.packed_rows())
+    top, left, bottom, right = box
+    if (bottom - top + 1) * (right - left + 1) > CENSUS_CELLS:
+        return object_census(engine.packed_rows(), window_only=True)
+    return object_census(engine.region_rows(top, left, bottom - top + 1, right - left + 1))
+
+
+def end_game(count: int = -1, cycle: str = "", seed: int | None = None,
+             objects: str = "") -> None:
+    """Finish the game and display the number of passed generations.
+
+    If the board ended up oscillating, the description of the cycle is displayed as well.
+    The objects left on the board are displayed, if they were counted.
+    The seed of a random board is displayed, so that the game can be played again.
     """
-    # Initialize buffer to avoid screen flickering for bigger boards
-    buffered_board = ""
-
-    clear()  # Clear the terminal
-
-    for row in local_board:
-        for cell in row:
-            # Color only if cell is alive
-            if cell:
-                buffered_board += f"{Back.GREEN}{2 * character}{Back.RESET}"
-            else:
-                buffered_board += 2 * character
-        buffered_board += "|\n"  # Separator and newline after row
-    buffered_board += "-" * len(local_board[0]) * 2 + "|"  # Add bottom separator
-    buffered_board += f"\nGeneration No. {gen_count}"
-
-    # Print only at the end to minimize flickering
-    print(buffered_board)
-
-
-def end_game(count: int = -1) -> None:
-    """Finish the game and display the number of passed generations."""
     print("""
 ░██████╗██╗███╗░░░███╗██╗░░░██╗██╗░░░░░░█████╗░████████╗██╗░█████╗░███╗░░██╗  ░█████╗░██╗░░░██╗███████╗██████╗░
 ██╔════╝██║████╗░████║██║░░░██║██║░░░░░██╔══██╗╚══██╔══╝██║██╔══██╗████╗░██║  ██╔══██╗██║░░░██║██╔════╝██╔══██╗
@@ -618,39 +725,58 @@ def end_game(count: int = -1) -> None:
 """)
     if count >= 0:
         print(f"Your game lasted {count} generation{'s' if count > 1 else ''}.")
+    if cycle:
+        print(cycle)
+    if objects:
+        print(objects)
+    if seed is not None:
+        print(f"Seed of the random board: {seed} (start again with -s {seed})")
     input("\nPress [Enter] to exit the game.")
     clear()
     # Exit program with code 0
     sys.exit(0)
 
-# Run the following even if module is imported
-set_dir_and_os()
-# Path to where the boards are stored
-BOARDS_PATH: str = os.path.abspath(os.path.join("..", "boards"))
-# Favourite boards
-FAVOURITES_PATH: str = os.path.abspath(os.path.join("..", "favourites"))
+# Keys that move the viewport, by rows and columns as a fraction of its size
+PAN_KEYS: dict[bytes, tuple[float, float]] = {
+    b"w": (-0.5, 0), b"s": (0.5, 0), b"a": (0, -0.5), b"d": (0, 0.5)
+}
 
-# Make necessary directories if they don't exist already
-os.makedirs(BOARDS_PATH, exist_ok=True)
-os.makedirs(FAVOURITES_PATH, exist_ok=True)
-
-# Only run the following if program is called explicitly
+# Only run the following if program is called explicitly, importing has no side effects
 if __name__ == "__main__":
     print("-" * 20)  # Visual separator
-
-    BACKGROUND_CHAR, TIMEOUT = handle_special_args()  # Check special args first
-    display_welcome()  # Only if no special args were called
+    # Make necessary directories if they don't exist already
+    ensure_folders()
+
+    SETTINGS: dict = handle_special_args()  # Check special args first
+    BACKGROUND_CHAR, TIMEOUT = SETTINGS["filler"], SETTINGS["timeout"]
+    HEADLESS: bool = SETTINGS["headless"] > 0
+    # Timings of every phase, costs next to nothing unless -i is used
+    PROFILER = Profiler(enabled=bool(SETTINGS["profile"]), path=SETTINGS["profile"])
+    if PROFILER.enabled:
+        # Also saved if the game ends with end_game() or Ctrl+C
+        atexit.register(PROFILER.save)
+    if not HEADLESS:
+        display_welcome()  # Only if no special args were called
+    # The stats of the profiler get their own line below the status line
+    STATUS_LINES: int = 1 + PROFILER.enabled
 
     # Initial configuration comes either from the user or is randomly generated
-    current_board: list[list[bool]] = get_start_board()
-    # Avoid stuck screens that only include still lives
-    last_board: list[list[bool]] = []
-    num_generations: int = 0  # Keep track of how many generations passed
-
-    print("Starting simulation...")
-    sleep(1.5)
-
-    if MSVCRT_ERR:
+    # Random boards fill the screen at the selected zoom level
+    current_board: list[list[bool]] | PatternStream = get_start_board(
+        HEADLESS, cells_on_screen(*terminal_area(STATUS_LINES), SETTINGS["zoom"]),
+        SETTINGS["density"], SETTINGS["seed"])
+    # Shown at the end, so that the random board can be made again
+    SEED: int | None = getattr(current_board, "seed", None)
+    if SEED is not None:
+        print(f"Random board {current_board.width}x{current_board.height}, "
+              f"density {SETTINGS['density']}, seed {SEED}")
+    # Keep track of how many generations passed, checkpoints continue where they were saved
+    num_generations: int = getattr(current_board, "generation", 0)
+
+    if not HEADLESS:
+        print("Starting simulation...")
+
+    if MSVCRT_ERR and not HEADLESS:
         # Warn the user that a part of the functionality won't work
         input("""
 Because you're either running an older python version or you're on a Unix OS, you can only
@@ -659,12 +785,137 @@ Like this, you won't be able to see the end stats, the game will just \"crash\".
 
 Press [Enter] to continue.""")
 
+    # -r overrides the rule of the file
+    try:
+        RULE = Rule(SETTINGS["rule"] or getattr(current_board, "rule", "") or CONWAY.name)
+    except ValueError as ex:
+        print(f"{Fore.RED}ERROR: {Fore.RESET}The rule of the file isn't supported. {ex}")
+        sys.exit(1)
+
+    # The engine keeps the board in its own representation from here on
+    try:
+        if SETTINGS["engine"] == "parallel":
+            engine: Engine = ParallelEngine(current_board, RULE, workers=SETTINGS["workers"])
+        else:
+            engine: Engine = ENGINES[SETTINGS["engine"]](current_board, RULE)
+    except FileInvalidError as ex:
+        # The cells of the file are only checked now, while the engine reads them
+        invalid_file(ex, sys.argv[1], HEADLESS)
+
+    if SETTINGS["jump"] > num_generations:
+        print(f"Jumping to generation {SETTINGS['jump']}...")
+        start_time = perf_counter()
+        engine.advance(SETTINGS["jump"] - num_generations)
+        num_generations = SETTINGS["jump"]
+
+        print(f"{Fore.GREEN}SUCCESS: {Fore.RESET}Jumped to generation {num_generations} "
+              f"in {perf_counter() - start_time:.3f} seconds.")
+        if engine.info():
+            print(engine.info())
+        if not HEADLESS:
+            sleep(1.5)
+
+        if engine.population() == 0 and not HEADLESS:
+            # Board died out before the target generation
+            end_game(num_generations, seed=SEED)
+
+    # Remember the starting board to detect oscillations
+    detector = CycleDetector()
+    detector.check(engine.fingerprint(), num_generations)
+
+    # Past generations for rewinding, headless runs only keep them to go back with -g.
+    # Rewinding needs the msvcrt keys, without them recording would be wasted time
+    HISTORY: History | None = None
+    if SETTINGS["history"] and ((not HEADLESS and not MSVCRT_ERR) or SETTINGS["seek"] >= 0):
+        HISTORY = History(engine.height, engine.width, int(SETTINGS["history"] * 2 ** 20))
+
+    if HEADLESS:
+        run_headless(engine, SETTINGS["headless"], detector, num_generations, SETTINGS["output"],
+                     SETTINGS["checkpoint"], PROFILER, HISTORY, SETTINGS["seek"])
+
+    # Only redraws the cells that changed since the last generation
+    renderer = DiffRenderer(BACKGROUND_CHAR)
+
+    # Only the part of the board that fits on the screen is drawn
+    viewport = Viewport(engine.height, engine.width, *terminal_area(STATUS_LINES), SETTINGS["zoom"])
+
+    # Generations are computed ahead on a separate thread, -t is the time between frames
+    worker = SimulationWorker(
+        engine, detector, num_generations, checkpoint=SETTINGS["checkpoint"],
+        on_checkpoint=lambda generation: save_checkpoint(engine, generation, checkpoint_filename()),
+        viewport=viewport, profiler=PROFILER, history=HISTORY)
+    scheduler = FrameScheduler(worker.buffer, TIMEOUT)
+    worker.start()
+
+    # Generation shown while going back through the history, None while the simulation runs
+    rewind: int | None = None
+    live: int = num_generations  # Latest generation of the simulation that was shown
+
     # Main game loop
-    while last_board != current_board:
-        num_generations += 1
-        print_board(current_board, num_generations, BACKGROUND_CHAR)
-        last_board = current_board
-        current_board = update_board(current_board, num_generations)
-        sleep(TIMEOUT)
-
-    end_game(num_generations)
+    while True:
+        if rewind is None:
+            wait_start = perf_counter()
+            frame = scheduler.next_frame(viewport.version)
+            # Time spent waiting for the frame, either for the deadline or for the worker
+            PROFILER.add(frame.generation, "wait", perf_counter() - wait_start)
+            if frame.end is not None:
+                # Board died out, only consists of still lives or oscillates
+                worker.stop()
+                end_game(frame.generation, frame.end, SEED,
+                         live_census(engine) if RULE == CONWAY else "")
+
+            # Generation numbers on the screen start at 1
+            live = frame.generation
+            num_generations = frame.generation + 1
+            status = [frame.status, viewport.describe(), RULE.name if RULE != CONWAY else ""]
+            if scheduler.dropped:
+                status.append(f"{scheduler.dropped} frames dropped")
+            status = " | ".join(filter(None, status))
+            if PROFILER.enabled:
+                status += "\n" + PROFILER.summary()
+            with PROFILER.phase(frame.generation, "render"):
+                renderer.render(frame.board, num_generations, status, frame.dirty)
+
+        else:
+            # Paused, the worker keeps recording, the oldest generations might be gone already
+            if rewind not in HISTORY:
+                rewind = HISTORY.first
+            _, board = viewport.capture(HISTORY.snapshot(rewind))
+            status = [f"Paused at generation {rewind + 1} of {live + 1}, [,] back, [.] forward",
+                      viewport.describe(), HISTORY.describe()]
+            renderer.render(board, rewind + 1, " | ".join(filter(None, status)))
+            # Nothing changes until a key is pressed
+            sleep(0.05)
+
+        # Credit to Mizipor on StackOverflow for the non-blocking input.
+        # Link to the thread: https://stackoverflow.com/questions/2408560/non-blocking-console-input
+        with PROFILER.phase(live, "input"):
+            key = msvcrt.getch().lower() if not MSVCRT_ERR and msvcrt.kbhit() else b""
+        # bkhit() check only works on Windows
+        if key == b"\r":
+            # User has pressed [Enter] to exit the game mid-simulation.
+            worker.stop()
+            worker.join()
+            # The worker is ahead of the screen, the history still has the generation on the screen
+            shown = live if rewind is None else rewind
+            if RULE != CONWAY:
+                objects = ""
+            elif HISTORY is not None and shown in HISTORY:
+                # The history only has the board, the window of unbounded engines
+                objects = object_census(HISTORY.rows(shown), window_only=engine.unbounded)
+            else:
+                objects = live_census(engine)
+            end_game(num_generations, seed=SEED, objects=objects)
+        elif key in PAN_KEYS:
+            viewport.pan(*PAN_KEYS[key])
+        elif key in (b"+", b"-"):
+            # [+] zooms in, showing fewer cells
+            viewport.zoom_by(-1 if key == b"+" else 1)
+        elif key in (b",", b".") and HISTORY is not None:
+            # [,] goes back a generation, [.] forward until the simulation continues
+            shown = (live if rewind is None else rewind) + (-1 if key == b"," else 1)
+            if shown >= live:
+                rewind = None
+                scheduler.resume()
+            elif shown in HISTORY:
+                rewind = shown
@@ -0,0 +1,313 @@
+"""Census of the objects on a board: still lives, oscillators, spaceships and guns.
+
+The live cells are split into clusters of touching cells in a single pass
+over the runs of live cells of every row. Every cluster is brought into a
+canonical form that doesn't depend on its position, rotation or
+reflection, and looked up in a table of known objects with all of their
+phases. Objects made of several clusters, like the Gosper glider gun or
+one phase of the beacon, are found by looking up groups of nearby clusters
+as a whole first. The known objects are the ones of Conway's rules.
+"""
+import re
+from bisect import bisect_right
+from collections import Counter
+
+from engines import BitEngine
+from loaders import read_cells
+from rules import CONWAY
+
+# Known objects: name, period and the rows of one phase in the plaintext format, separated by spaces
+STILL_LIVES: tuple[tuple[str, int, str], ...] = (
+    ("block", 1, "OO OO"),
+    ("beehive", 1, ".OO. O..O .OO."),
+    ("loaf", 1, ".OO. O..O .O.O ..O."),
+    ("boat", 1, "OO. O.O .O."),
+    ("ship", 1, "OO. O.O .OO"),
+    ("tub", 1, ".O. O.O .O."),
+    ("pond", 1, ".OO. O..O O..O .OO."),
+    ("long boat", 1, "OO.. O.O. .O.O ..O."),
+    ("barge", 1, ".O.. O.O. .O.O ..O."),
+    ("mango", 1, ".OO.. O..O. .O..O ..OO."),
+    ("snake", 1, "OO.O O.OO"),
+    ("aircraft carrier", 1, "OO.. O..O ..OO"),
+    ("eater", 1, "OO.. O.O. ..O. ..OO"),
+)
+OSCILLATORS: tuple[tuple[str, int, str], ...] = (
+    ("blinker", 2, "OOO"),
+    ("toad", 2, ".OOO OOO."),
+    ("beacon", 2, "OO.. OO.. ..OO ..OO"),
+    ("pulsar", 3, "..OOO...OOO.. ............. O....O.O....O O....O.O....O O....O.O....O "
+                  "..OOO...OOO.. ............. ..OOO...OOO.. O....O.O....O O....O.O....O "
+                  "O....O.O....O ............. ..OOO...OOO.."),
+    ("pentadecathlon", 15, "..O....O.. OO.OOOO.OO ..O....O.."),
+    ("101", 5, "....OO......OO.... ...O.O......O.O... ...O..........O... OO.O..........O.OO "
+               "OO.O.O..OO..O.O.OO ...O.O.O..O.O.O... ...O.O.O..O.O.O... OO.O.O..OO..O.O.OO "
+               "OO.O..........O.OO ...O..........O... ...O.O......O.O... ....OO......OO...."),
+)
+SPACESHIPS: tuple[tuple[str, int, str], ...] = (
+    ("glider", 4, ".O. ..O OOO"),
+    ("lightweight spaceship", 4, ".O..O O.... O...O OOOO."),
+    ("middleweight spaceship", 4, "...O.. .O...O O..... O....O OOOOO."),
+    ("heavyweight spaceship", 4, "...OO.. .O....O O...... O.....O OOOOOO."),
+)
+# Looked up without the spaceships they emitted, so the gliders are counted on their own
+GUNS: tuple[tuple[str, int, str], ...] = (
+    ("Gosper glider gun", 30,
+     "........................O........... ......................O.O........... "
+     "............OO......OO............OO ...........O...O....OO............OO "
+     "OO........O.....O...OO.............. OO........O...O.OO....O.O........... "
+     "..........O.....O.......O........... ...........O...O.................... "
+     "............OO......................"),
+)
+
+# Runs of live cells in the binary digits of a row, lowest bit first
+RUN = re.compile("1+")
+
+# Canonical form of every phase of the known objects, built on first use by known_objects()
+_known_objects: dict[tuple[tuple[int, int], ...], str] = {}
+# Cells, height and width of the known objects, clusters with other sizes are skipped right away
+_sizes: set[tuple[int, int, int]] = set()
+# Distance between the clusters of the known objects that consist of several, e.g. 14 for the gun
+_spreads: set[int] = set()
+_spaceships: set[str] = {name for name, _, _ in SPACESHIPS}
+
+# A cluster with its runs, cells and name ("" if unknown)
+Cluster = tuple[list[tuple[int, int, int]], list[tuple[int, int]], str]
+
+
+def label(rows: list[int]) -> list[list[tuple[int, int, int]]]:
+    """Return the clusters of touching live cells, diagonals included, of a board of packed rows.
+
+    A cluster is a list of runs (row, first column, last column). Every run
+    is joined with the runs of the row above that touch it, so the board is
+    read once, and the cost follows the number of runs instead of cells.
+    """
+    runs: list[tuple[int, int, int]] = []
+    parent: list[int] = []
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            # Path halving keeps the trees flat
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    # First and last column and index of the runs of the row above
+    above: list[tuple[int, int, int]] = []
+    for r, row in enumerate(rows):
+        current = []
+        if row:
+            j = 0
+            for match in RUN.finditer(bin(row)[:1:-1]):
+                first, last = match.start(), match.end() - 1
+                index = len(runs)
+                runs.append((r, first, last))
+                parent.append(index)
+                # Runs above that end left of this one can't touch the next ones either
+                while j < len(above) and above[j][1] < first - 1:
+                    j += 1
+                k = j
+                while k < len(above) and above[k][0] <= last + 1:
+                    root, other = find(index), find(above[k][2])
+                    if root != other:
+                        parent[max(root, other)] = min(root, other)
+                    k += 1
+                current.append((first, last, index))
+        above = current
+
+    clusters: dict[int, list[tuple[int, int, int]]] = {}
+    for index, run in enumerate(runs):
+        clusters.setdefault(find(index), []).append(run)
+    return list(clusters.values())
+
+
+def cells_of(runs: list[tuple[int, int, int]]) -> list[tuple[int, int]]:
+    """Return the (row, column) of every cell of a list of runs."""
+    return [(r, c) for r, first, last in runs for c in range(first, last + 1)]
+
+
+def size_of(cells: list[tuple[int, int]]) -> tuple[int, int, int]:
+    """Return the number of cells and the smaller and bigger side of the bounding box."""
+    rows = [r for r, _ in cells]
+    columns = [c for _, c in cells]
+    height, width = max(rows) - min(rows) + 1, max(columns) - min(columns) + 1
+    return len(cells), min(height, width), max(height, width)
+
+
+def canonical(cells: list[tuple[int, int]]) -> tuple[tuple[int, int], ...]:
+    """Return the smallest of the 8 rotations and reflections of the cells, moved to the corner.
+
+    All orientations and positions of an object have the same canonical form.
+    """
+    forms = []
+    for flip_rows in (1, -1):
+        for flip_columns in (1, -1):
+            for transpose in (False, True):
+                moved = [(flip_rows * r, flip_columns * c) for r, c in cells]
+                if transpose:
+                    moved = [(c, r) for r, c in moved]
+                top = min(r for r, _ in moved)
+                left = min(c for _, c in moved)
+                forms.append(tuple(sorted((r - top, c - left) for r, c in moved)))
+    return min(forms)
+
+
+def lookup(cells: list[tuple[int, int]]) -> str:
+    """Return the name of the known object made of the cells, "" if there is none."""
+    known = known_objects()
+    if size_of(cells) not in _sizes:
+        # Most clusters of a busy board are too big to be anything known
+        return ""
+    return known.get(canonical(cells), "")
+
+
+def _add_object(name: str, period: int, picture: str) -> None:
+    """Add the canonical form of every phase of an object to the known objects."""
+    pattern = list(read_cells(picture.split()))
+    # Room for the gliders of a gun to fly off during the two periods
+    margin = period // 2 + 4
+    width = len(pattern[0]) + 2 * margin
+    board = [[False] * width for _ in range(margin)]
+    board += [[False] * margin + row + [False] * (width - margin - len(row)) for row in pattern]
+    board += [[False] * width for _ in range(margin)]
+    engine = BitEngine(board, CONWAY)
+
+    # The first period lets a gun emit its gliders, the second one is recorded
+    engine.advance(period)
+    spread = 1
+    for _ in range(period):
+        rows = engine.packed_rows()
+        if name not in _spaceships:
+            # Emitted gliders are found on their own and don't belong to the gun
+            rows = list(rows)
+            for runs in label(rows):
+                if lookup(cells_of(runs)) in _spaceships:
+                    for r, first, last in runs:
+                        rows[r] &= ~(((1 << (last - first + 1)) - 1) << first)
+        cells = [cell for runs in label(rows) for cell in cells_of(runs)]
+        _known_objects[canonical(cells)] = name
+        _sizes.add(size_of(cells))
+
+        # Smallest distance that joins all clusters of every phase into one group
+        while len(_spread(rows, spread)) > 1:
+            spread += 1
+        engine.step()
+    if spread > 1:
+        _spreads.add(spread)
+
+
+def known_objects() -> dict[tuple[tuple[int, int], ...], str]:
+    """Return the names of the known objects by their canonical form, built on first use."""
+    if not _known_objects:
+        # Spaceships first, the guns are recorded without them
+        for name, period, picture in SPACESHIPS + STILL_LIVES + OSCILLATORS + GUNS:
+            _add_object(name, period, picture)
+    return _known_objects
+
+
+def _spread(rows: list[int], distance: int) -> list[list[tuple[int, int, int]]]:
+    """Return the clusters of the live cells that are at most distance cells apart.
+
+    Every cell is spread distance - 1 cells to the right and down, so that
+    cells close enough to each other end up touching.
+    """
+    spread = list(rows) + [0] * (distance - 1)
+    done = 1
+    while done < distance:
+        # Doubling the spread every time, like a sliding window of width distance
+        step = min(done, distance - done)
+        spread = [row | row << step for row in spread]
+        spread = [row | (spread[i - step] if i >= step else 0) for i, row in enumerate(spread)]
+        done += step
+    return label(spread)
+
+
+def _groups(clusters: list[Cluster], distance: int, height: int) -> list[list[Cluster]]:
+    """Return the clusters in groups of the ones that are at most distance cells apart."""
+    rows = [0] * height
+    for runs, _, _ in clusters:
+        for r, first, last in runs:
+            rows[r] |= ((1 << (last - first + 1)) - 1) << first
+
+    # Runs of every row of the spread board, to find the group of a cell with bisect
+    spread = _spread(rows, distance)
+    group_runs: dict[int, list[tuple[int, int]]] = {}
+    for group, runs in enumerate(spread):
+        for r, first, _ in runs:
+            group_runs.setdefault(r, []).append((first, group))
+    for runs in group_runs.values():
+        runs.sort()
+
+    groups: list[list[Cluster]] = [[] for _ in spread]
+    for cluster in clusters:
+        r, c = cluster[1][0]
+        runs = group_runs[r]
+        groups[runs[bisect_right(runs, (c, len(spread))) - 1][1]].append(cluster)
+    return groups
+
+
+def _lookup_group(group: list[Cluster]) -> tuple[str, list[Cluster]]:
+    """Return the known object made of a group of clusters and the clusters that aren't part of it.
+
+    A known object right next to another cluster, like the eater below the
+    gun of glider_gun.gol, is found by leaving out one cluster at a time.
+    """
+    cells = [cell for _, cluster_cells, _ in group for cell in cluster_cells]
+    name = lookup(cells)
+    if name or len(cells) > 2 * max(population for population, _, _ in _sizes):
+        # Big groups are never tried without a cluster, the census stays linear
+        return name, [] if name else group
+
+    for i in range(len(group)):
+        name = lookup([cell for j, (_, cluster_cells, _) in enumerate(group) if j != i
+                       for cell in cluster_cells])
+        if name:
+            return name, [group[i]]
+    return "", group
+
+
+def find_objects(rows: list[int]) -> Counter[str]:
+    """Return how often each known object occurs on a board of packed rows.
+
+    Clusters that aren't known objects are counted as "unknown". Spaceships
+    are counted first. The other clusters are looked up in groups of the
+    ones close to each other, starting with the biggest distance between the
+    parts of a known object, and only on their own if no group is known.
+    """
+    known_objects()
+    objects: Counter[str] = Counter()
+    clusters: list[Cluster] = []
+    for runs in label(rows):
+        cells = cells_of(runs)
+        name = lookup(cells)
+        if name in _spaceships:
+            objects[name] += 1
+        else:
+            clusters.append((runs, cells, name))
+
+    for distance in sorted(_spreads, reverse=True):
+        left: list[Cluster] = []
+        for group in _groups(clusters, distance, len(rows)):
+            if len(group) == 1:
+                left += group
+                continue
+            name, rest = _lookup_group(group)
+            if name:
+                objects[name] += 1
+            left += rest
+        clusters = left
+
+    for _, _, name in clusters:
+        objects[name or "unknown"] += 1
+    return objects
+
+
+def describe_objects(objects: Counter[str]) -> str:
+    """Return the objects for the end of the game, the most common first."""
+    if not objects:
+        return "Objects: none"
+    # Unknown objects last, they are the least interesting
+    known = [(name, count) for name, count in objects.most_common() if name != "unknown"]
+    if objects["unknown"]:
+        known.append(("unknown", objects["unknown"]))
+    return "Objects: " + ", ".join(f"{count}x {name}" for name, count in known)
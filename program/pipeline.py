@@ -0,0 +1,199 @@
+"""Pipelined simulation, generations are computed on a worker thread while frames are drawn.
+
+The worker runs ahead of the display and fills a bounded buffer with
+boards. The frame scheduler takes them out at a fixed frame period and
+drops frames whenever drawing falls behind, so the speed of the
+simulation doesn't depend on how long it takes to compute a generation.
+"""
+import threading
+from queue import Empty, Full, Queue
+from time import perf_counter, sleep
+from typing import Callable, NamedTuple
+
+from engines import Engine
+from cycles import CycleDetector
+from viewport import Viewport
+from profiler import Profiler
+from history import History
+
+
+class Frame(NamedTuple):
+    """One generation computed by the worker."""
+    generation: int
+    board: list[list[bool]] | list[str]  # Visible part of the board, see Viewport.capture()
+    status: str  # Engine statistics at this generation
+    # None while the game goes on, otherwise the reason it ended ("" or a cycle description)
+    end: str | None = None
+    view: int = 0  # Version of the viewport the board was captured with
+    # Lines of the board that changed since the previous frame, None if the engine doesn't know
+    dirty: set[int] | None = None
+
+
+class SimulationWorker(threading.Thread):
+    """Step an engine on a separate thread and put every generation into a bounded buffer.
+
+    The worker waits whenever the buffer is full, so it never runs more than
+    buffer_size generations ahead of the display. The last frame has no
+    board, its end is set once the board died out, only consists of still
+    lives or oscillates.
+    Only the part of the board inside the viewport is captured, if there is one.
+    The phases of every generation are timed by the profiler, if it is enabled.
+    Every generation is recorded in the history, if there is one.
+    """
+    def __init__(self, engine: Engine, detector: CycleDetector, start: int = 0,
+                 buffer_size: int = 64, checkpoint: int = 0,
+                 on_checkpoint: Callable[[int], None] | None = None,
+                 viewport: Viewport | None = None, profiler: Profiler | None = None,
+                 history: History | None = None):
+        # Daemon, so that end_game() can exit the program while the worker waits
+        super().__init__(daemon=True)
+        self.engine: Engine = engine
+        self.detector: CycleDetector = detector
+        self.start_generation: int = start
+        self.buffer: Queue = Queue(buffer_size)
+        # on_checkpoint(generation) is called every checkpoint generations
+        self.checkpoint: int = checkpoint
+        self.on_checkpoint = on_checkpoint
+        self.viewport: Viewport | None = viewport
+        self.profiler: Profiler = profiler or Profiler(enabled=False)
+        self.history: History | None = history
+        self.stopped = threading.Event()
+
+    def _capture(self, generation: int) -> Frame:
+        """Return the frame of the current generation of the engine."""
+        stats = self.engine.stats
+        with self.profiler.phase(generation, "capture"):
+            if self.viewport is None:
+                return Frame(generation, self.engine.to_board(), self.engine.info(),
+                             dirty=None if stats is None else set(stats.dirty))
+            view, board = self.viewport.capture(self.engine)
+            dirty = None if stats is None else self.viewport.dirty_lines(stats.dirty, view)
+            return Frame(generation, board, self.engine.info(), view=view, dirty=dirty)
+
+    def _record(self, generation: int) -> None:
+        """Store the current generation of the engine in the history."""
+        if self.history is not None:
+            with self.profiler.phase(generation, "history"):
+                stats = self.engine.stats
+                if stats is None:
+                    self.history.record(generation, self.engine.packed_rows())
+                else:
+                    # Only the rows that changed are read
+                    self.history.record(generation, stats.rows, stats.dirty)
+
+    def _put(self, frame: Frame) -> bool:
+        """Put a frame into the buffer, waiting for space. Return False if the worker was stopped."""
+        while not self.stopped.is_set():
+            try:
+                self.buffer.put(frame, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def run(self) -> None:
+        engine, detector, profiler = self.engine, self.detector, self.profiler
+        generation = self.start_generation
+        profiler.count(generation, engine)
+        self._record(generation)
+        frame = self._capture(generation)
+
+        while self._put(frame):
+            generation += 1
+            with profiler.phase(generation, "step"):
+                changed = engine.step()
+            profiler.count(generation, engine)
+            self._record(generation)
+            if self.checkpoint and generation % self.checkpoint == 0:
+                with profiler.phase(generation, "checkpoint"):
+                    self.on_checkpoint(generation)
+
+            with profiler.phase(generation, "checks"):
+                # Entire board is dead, or only still lives are left
+                end = "" if engine.population() == 0 or not changed else None
+                if end is None and detector.check(engine.fingerprint(), generation):
+                    # Board is oscillating, it would repeat itself forever
+                    end = detector.describe()
+
+            if end is not None:
+                frame = Frame(generation, [], "", end)
+            else:
+                frame = self._capture(generation)
+                continue
+            self._put(frame)
+            return
+
+    def stop(self) -> None:
+        """Stop computing generations, e.g. before the program exits."""
+        self.stopped.set()
+
+
+class FrameScheduler:
+    """Take frames out of the buffer of a worker at a fixed frame period.
+
+    If drawing or computing falls behind, the frames that should have been
+    shown in the meantime are dropped if they are already computed. With
+    a period of 0, every frame is shown as fast as possible.
+    The dirty lines of dropped frames are added to the next frame, so that
+    it has all lines that changed since the last frame that was shown.
+    """
+    def __init__(self, buffer: Queue, period: float):
+        self.buffer: Queue = buffer
+        self.period: float = period
+        self.deadline: float = 0.0  # Time at which the next frame should be shown
+        self.dropped: int = 0
+        # Viewport version of the last frame, None before the first one or after a pause
+        self.view: int | None = None
+
+    def resume(self) -> None:
+        """Start a new schedule after a pause, so that the frames of the pause aren't dropped.
+
+        Something else was drawn during the pause, the next frame has no dirty lines.
+        """
+        self.deadline = 0.0
+        self.view = None
+
+    def _get(self, frame: Frame | None, block: bool = True) -> Frame:
+        """Take the next frame out of the buffer, with the dirty lines of the frame before it added."""
+        following: Frame = self.buffer.get() if block else self.buffer.get_nowait()
+        if frame is None or following.dirty is None:
+            return following
+        if frame.dirty is None:
+            return following._replace(dirty=None)
+        return following._replace(dirty=frame.dirty | following.dirty)
+
+    def next_frame(self, view: int = 0) -> Frame:
+        """Wait until the next frame is due and return it.
+
+        Frames captured with an older version of the viewport than view are skipped.
+        """
+        frame: Frame = self._get(None)
+        while frame.view < view and frame.end is None:
+            frame = self._get(frame)
+        now = perf_counter()
+        if not self.deadline:
+            self.deadline = now
+
+        if self.period and now - self.deadline >= self.period:
+            # Behind schedule, skip one frame per missed frame period
+            missed = int((now - self.deadline) / self.period)
+            skipped = 0
+            while skipped < missed and frame.end is None:
+                try:
+                    frame = self._get(frame, block=False)
+                except Empty:
+                    # Computing is the bottleneck, nothing to skip
+                    break
+                skipped += 1
+            self.dropped += skipped
+            # Stay on schedule, but don't rush through frames that couldn't be computed in time
+            self.deadline = self.deadline + missed * self.period if skipped == missed else now
+        elif self.deadline > now:
+            sleep(self.deadline - now)
+
+        self.deadline += self.period
+        if frame.view != self.view:
+            # The viewport moved since the last frame, every line is different
+            frame = frame._replace(dirty=None)
+        self.view = frame.view
+        return frame
@@ -0,0 +1,140 @@
+"""Instrumentation of the simulation, records how long each phase of a generation takes.
+
+Phases are timed with profiler.phase(generation, name) blocks. A disabled
+profiler returns the same empty context manager for every phase, so the
+instrumentation costs next to nothing unless it's switched on with -i.
+"""
+import os
+import csv
+import json
+import threading
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+from time import perf_counter
+
+from engines import Engine
+
+# Phases of a generation in the order they are shown, worker thread first
+PHASES: tuple = ("step", "checks", "capture", "checkpoint", "history", "wait", "render", "input")
+# Generations used for the averages of the live stats line
+RECENT: int = 50
+COLUMNS: tuple = ("generation", *PHASES, "population", "changed")
+
+
+class Profiler:
+    """Per-generation timings of every phase, population and number of changed cells.
+
+    Only the latest max_rows generations are kept in memory. The trace is
+    saved to path as JSON or CSV, depending on the extension. A CSV trace
+    has every generation, older generations are written to the file while
+    the game runs. A JSON trace has the latest generations and the totals
+    of all of them.
+    """
+    def __init__(self, enabled: bool = True, path: str = "", max_rows: int = 4096):
+        self.enabled: bool = enabled
+        self.path: str = path
+        self.max_rows: int = max_rows
+        # Generation -> {"generation": ..., phase: seconds, "population": ..., "changed": ...}
+        self.rows: dict[int, dict] = {}
+        self.totals: dict[str, float] = dict.fromkeys(PHASES, 0.0)  # Seconds of every generation
+        self.generations: int = 0  # Generations recorded so far, including the forgotten ones
+        self._writer = None  # CSV writer, once the first generations are written
+        self._file = None
+        # The worker thread and the main thread both add generations
+        self.lock = threading.Lock()
+        self.counted: bool = False  # Whether a generation was counted yet
+        self._disabled = nullcontext()
+
+    def _row(self, generation: int) -> dict:
+        """Return the row of a generation, creating it if needed."""
+        row = self.rows.get(generation)
+        if row is None:
+            with self.lock:
+                if generation in self.rows:
+                    # The other thread was faster
+                    return self.rows[generation]
+                row = self.rows[generation] = {"generation": generation}
+                self.generations += 1
+                if len(self.rows) > self.max_rows:
+                    # Forget the oldest generation, a CSV trace gets it first
+                    self._write([self.rows.pop(next(iter(self.rows)))])
+        return row
+
+    def _write(self, rows: list[dict]) -> None:
+        """Append rows to the CSV trace, creating it on the first call. Does nothing for JSON traces."""
+        if not self.path.lower().endswith(".csv"):
+            return
+        if self._writer is None:
+            self._file = open(self.path, "w", encoding="utf-8", newline="")  # pylint: disable=consider-using-with
+            self._writer = csv.DictWriter(self._file, COLUMNS)
+            self._writer.writeheader()
+        self._writer.writerows(rows)
+
+    def phase(self, generation: int, name: str):
+        """Return a context manager that adds the time spent in it to a phase of a generation."""
+        if not self.enabled:
+            return self._disabled
+        return self._timed(generation, name)
+
+    @contextmanager
+    def _timed(self, generation: int, name: str):
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(generation, name, perf_counter() - start)
+
+    def add(self, generation: int, name: str, seconds: float) -> None:
+        """Add time measured elsewhere to a phase of a generation."""
+        if self.enabled:
+            row = self._row(generation)
+            row[name] = row.get(name, 0.0) + seconds
+            self.totals[name] += seconds
+
+    def count(self, generation: int, engine: Engine) -> None:
+        """Record the population and the number of cells that changed since the last call.
+
+        The changed cells come from the statistics of the engine, engines without them leave them out.
+        """
+        if not self.enabled:
+            return
+        row = self._row(generation)
+        row["population"] = engine.population()
+        if self.counted and engine.stats is not None:
+            row["changed"] = engine.stats.changed
+        self.counted = True
+
+    def summary(self) -> str:
+        """Return the live stats line, average milliseconds per phase of the latest generations."""
+        # The worker thread adds and forgets generations meanwhile
+        with self.lock:
+            recent = list(islice(reversed(self.rows.values()), RECENT))[::-1]
+        if not recent:
+            return ""
+        parts: list[str] = []
+        for name in PHASES:
+            times = [row[name] for row in recent if name in row]
+            if times:
+                parts.append(f"{name} {sum(times) / len(times) * 1000:.2f} ms")
+
+        last = next((row for row in reversed(recent) if "population" in row), {})
+        if last:
+            parts.append(f"population {last['population']}")
+        if "changed" in last:
+            parts.append(f"changed {last['changed']}")
+        return " | ".join(parts)
+
+    def save(self) -> None:
+        """Save the trace as JSON or CSV (if the path ends with .csv). Times are in seconds."""
+        with self.lock:
+            rows = list(self.rows.values())
+            if self.path.lower().endswith(".csv"):
+                self._write(rows)
+                self._file.close()
+                saved = f"{self.generations} generations"
+            else:
+                with open(self.path, "w", encoding="utf-8") as fp:
+                    json.dump({"columns": COLUMNS, "totals": self.totals, "generations": rows}, fp)
+                saved = (f"the last {len(rows)} of {self.generations} generations"
+                         if len(rows) < self.generations else f"{len(rows)} generations")
+        print(f"Trace of {saved} saved to {os.path.abspath(self.path)}")
@@ -0,0 +1,120 @@
+"""Terminal renderer that only redraws the cells that changed since the last frame."""
+import sys
+from itertools import groupby
+
+from colorama import Back, Cursor, Fore, ansi
+
+
+def render_cells(cells: list[bool], character: str = " ") -> str:
+    """Return the string for a row of cells.
+
+    Runs of cells with the same colour share one colour escape sequence.
+    Every cell is 2 characters wide.
+    """
+    parts: list[str] = []
+    for alive, run in groupby(cells):
+        text = 2 * character * len(list(run))
+        parts.append(f"{Back.GREEN}{text}{Back.RESET}" if alive else text)
+    return "".join(parts)
+
+
+def render_row(row: list[bool] | str, character: str = " ") -> str:
+    """Return the string for a row of cells, or for a line of characters of the viewport.
+
+    Lines of half block or braille characters (see viewport.py) are drawn in green.
+    """
+    if isinstance(row, str):
+        return f"{Fore.GREEN}{row}{Fore.RESET}"
+    return render_cells(row, character)
+
+
+def row_width(row: list[bool] | str) -> int:
+    """Return the number of characters a row takes up on the screen."""
+    return len(row) if isinstance(row, str) else 2 * len(row)
+
+
+def build_frame(local_board: list[list[bool]] | list[str], gen_count: int,
+                character: str = " ") -> str:
+    """Build the string for one complete frame of the board, including the generation count.
+
+    Live cells are displayed as green.
+    The specified character is used to fill the cells, default is empty.
+    """
+    # Separator and newline after every row
+    rows = [f"{render_row(row, character)}|\n" for row in local_board]
+    # Bottom separator and generation count
+    rows.append("-" * row_width(local_board[0]) + f"|\nGeneration No. {gen_count}")
+    return "".join(rows)
+
+
+class DiffRenderer:
+    """Draw boards by rewriting only what changed since the previous frame.
+
+    The first frame is drawn completely. Afterwards, the cursor is moved to
+    the changed part of each changed row using ANSI escape sequences, so
+    the screen never has to be cleared and doesn't flicker.
+    Boards can be rows of cells or lines of characters from the viewport.
+    """
+    def __init__(self, character: str = " "):
+        self.character: str = character
+        self.previous: list[list[bool]] | list[str] = []
+        self.status: str = ""  # Status line of the previous frame
+
+    def build(self, local_board: list[list[bool]] | list[str], gen_count: int,
+              status: str = "", dirty: set[int] | None = None) -> str:
+        """Return the string that turns the previous frame into this one.
+
+        The status, e.g. engine statistics, is displayed below the generation count.
+        It can have several lines separated by newlines.
+        Only the rows in dirty are compared with the previous frame if the
+        engine knows which rows changed, otherwise all of them.
+        """
+        height = len(local_board)
+
+        if (len(self.previous) != height
+                or type(self.previous[0]) is not type(local_board[0])
+                or len(self.previous[0]) != len(local_board[0])):
+            # First frame, or the board changed its size: draw everything
+            output = ansi.clear_screen() + Cursor.POS(1, 1) \
+                + build_frame(local_board, gen_count, self.character)
+
+        else:
+            parts: list[str] = []
+            rows = range(height) if dirty is None else sorted(i for i in dirty if i < height)
+            for i in rows:
+                row, old_row = local_board[i], self.previous[i]
+                if row == old_row:
+                    continue
+
+                # Only rewrite from the first to the last changed cell
+                first = next(j for j, (new, old) in enumerate(zip(row, old_row)) if new != old)
+                last = len(row) - next(j for j, (new, old)
+                                       in enumerate(zip(reversed(row), reversed(old_row)))
+                                       if new != old)
+                # Terminal positions start at 1, every cell is 2 characters wide
+                parts.append(Cursor.POS(row_width(row[:first]) + 1, i + 1))
+                parts.append(render_row(row[first:last], self.character))
+
+            # Generation count below the bottom separator
+            parts.append(Cursor.POS(1, height + 2) + ansi.clear_line() + f"Generation No. {gen_count}")
+            output = "".join(parts)
+
+        # Status lines below the generation count, lines that are gone are cleared
+        lines = status.split("\n") if status else []
+        old_lines = self.status.split("\n") if self.status else []
+        for i in range(max(len(lines), len(old_lines))):
+            output += Cursor.POS(1, height + 3 + i) + ansi.clear_line()
+            if i < len(lines):
+                output += lines[i]
+        self.status = status
+
+        # Engines never change a board after returning it, no copy needed
+        self.previous = local_board
+        # Leave the cursor below the board for any following output
+        return output + Cursor.POS(1, height + 3 + max(len(lines), 1))
+
+    def render(self, local_board: list[list[bool]] | list[str], gen_count: int,
+               status: str = "", dirty: set[int] | None = None) -> None:
+        """Draw the board with a single write to the terminal."""
+        sys.stdout.write(self.build(local_board, gen_count, status, dirty))
+        sys.stdout.flush()
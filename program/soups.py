@@ -0,0 +1,98 @@
+"""Random boards ("soups") with a seed and a density of live cells.
+
+Rows are made directly in the bit-packed form of pack_row() from a few
+random words each, instead of drawing a random number for every cell. The
+board is a stream like the pattern files, so engines build their own
+representation from it without a list[list[bool]] board in between, and
+the same seed always gives the same board.
+"""
+import random
+import shutil
+from typing import Iterator
+
+from loaders import PatternStream, unpack_row
+
+# Densities are rounded to multiples of 1 / 2 ** DENSITY_BITS
+DENSITY_BITS: int = 16
+
+
+def random_row(rng: random.Random, width: int, density: float) -> int:
+    """Return a packed row of random cells, each alive with a chance of density.
+
+    The binary digits of the density are applied from the lowest to the
+    highest: OR with a random word for a 1, AND for a 0. Every step halves
+    the chance of a cell being dead (OR) or alive (AND), so after all digits
+    it's alive with the chance of density. A density of 0.5 takes a single
+    random word, 0.3 takes 16.
+    """
+    level = round(density * (1 << DENSITY_BITS))
+    if level <= 0:
+        return 0
+    if level >= 1 << DENSITY_BITS:
+        return (1 << width) - 1
+
+    # Digits below the lowest 1 would only AND zeros
+    lowest = (level & -level).bit_length() - 1
+    row = 0
+    for bit in range(lowest, DENSITY_BITS):
+        if level >> bit & 1:
+            row |= rng.getrandbits(width)
+        else:
+            row &= rng.getrandbits(width)
+    return row
+
+
+class RandomPattern(PatternStream):
+    """Rows of a random board, generated again each time the stream is iterated.
+
+    Without a seed, a random one is picked. It's available as seed, so the
+    board can be made again, e.g. to reproduce a slow run.
+    """
+    def __init__(self, height: int, width: int, density: float = 0.5,
+                 seed: int | None = None):  # pylint: disable=super-init-not-called
+        self.height: int = height
+        self.width: int = width
+        self.density: float = density
+        self.seed: int = random.randrange(1 << 32) if seed is None else seed
+        self.rule: str = ""
+
+    def __iter__(self) -> Iterator[list[bool]]:
+        return (unpack_row(packed, self.width) for packed in self.packed_rows())
+
+    def packed_rows(self) -> Iterator[int]:
+        # A new generator every time, every iteration gives the same rows
+        rng = random.Random(self.seed)
+        for _ in range(self.height):
+            yield random_row(rng, self.width, self.density)
+
+
+def terminal_area(status_lines: int = 1) -> tuple[int, int]:
+    """Return the number of lines and columns of the terminal that the board can use.
+
+    Space is left for the specified number of status lines.
+    """
+    # Falls back to 80x24 if there is no terminal, e.g. in headless mode
+    terminal = shutil.get_terminal_size()
+    # Terminal rendering doesn't like fullscreen, make place for generation count and separator
+    return terminal.lines - 2 - status_lines, terminal.columns - 2
+
+
+def generate_random_board(height: int = -1, width: int = -1, density: float = 0.5,
+                          seed: int | None = None) -> RandomPattern:
+    """Generates a random starting configuration of a board.
+
+    Arguments specify the size of the board.
+    A cell has a chance of density (default 50%) to contain a counter.
+    The same seed gives the same board, without a seed a random one is picked.
+
+    If the args are -1 for both height and width, the numbers will be
+    selected so that the game consumes the entire screen.
+    The board is a stream of rows (see RandomPattern), use list() for a list[list[bool]] board.
+    """
+    if (height, width) == (-1, -1):
+        # Fill the entire screen
+        lines, columns = terminal_area()
+        # One cell is 2 chars wide
+        height, width = lines, columns // 2
+
+    return RandomPattern(height, width, density, seed)
@@ -0,0 +1,125 @@
+"""Statistics of a board of bit-packed rows that are kept up to date as rows change.
+
+Counting the population and hashing the board used to read every row in
+every generation. Engines tell RowStats which rows changed in a step and
+it only looks at those, so checking for extinction, still lives and
+cycles costs the same no matter how big the board is.
+"""
+from functools import reduce
+from itertools import compress, repeat
+from operator import ne, xor
+
+
+def rows_hash(indices, rows, width: int) -> int:
+    """Return the XOR of the hashes of (index, row) pairs, the board hash covers all rows.
+
+    Changing a row only changes its own hash, so it can be swapped out of the
+    board hash with two more XORs. Rows are hashed as bytes, hash() of an int
+    is taken modulo 2^61 - 1, so rows shifted by 61 columns would have the
+    same hash.
+    """
+    size = (width + 7) // 8
+    return reduce(xor, map(hash, zip(indices, map(int.to_bytes, rows, repeat(size), repeat("little")))), 0)
+
+
+def bounding_box(rows: list[int]) -> tuple[int, int, int, int] | None:
+    """Return the first and last row and column with live cells, or None if there are none."""
+    filled = [i for i, row in enumerate(rows) if row]
+    if not filled:
+        return None
+    columns = 0
+    for i in filled:
+        columns |= rows[i]
+    # Lowest and highest set bit of all rows
+    return filled[0], (columns & -columns).bit_length() - 1, filled[-1], columns.bit_length() - 1
+
+
+class RowStats:
+    """Population, hash, changed rows and bounding box of a board of bit-packed rows.
+
+    Engines hand the rows they changed in a step to update(), which writes
+    them into the rows and only does work for those rows. Engines that
+    compute every row use replace() instead. They are kept in
+    dirty until the next step, together with the number of cells that
+    changed. The bounding box is only computed when it's asked for, and
+    only again after the board changed.
+    """
+    def __init__(self, rows: list[int], width: int):
+        self.width: int = width
+        self.population: int = sum(map(int.bit_count, rows))
+        self.hash: int = rows_hash(range(len(rows)), rows, width)
+        # Rows that changed in the last step, all rows count as changed at the start
+        self.dirty: list[int] = list(range(len(rows)))
+        self.changed: int = 0  # Cells that changed in the last step
+        # Shared with the engine, update() changes it in place
+        self.rows: list[int] = rows
+        self._box: tuple[int, int, int, int] | None = None
+        self._box_stale: bool = True  # Board changed since the bounding box was computed
+
+    def update(self, dirty: list[int], new: list[int]) -> bool:
+        """Write the new rows of the rows at the indices in dirty, the rows that changed in a step.
+
+        Return whether any row changed.
+        """
+        self.dirty = dirty
+        if not dirty:
+            self.changed = 0
+            return False
+
+        rows = self.rows
+        old = list(map(rows.__getitem__, dirty))
+        self.changed = sum(map(int.bit_count, map(xor, old, new)))
+        for i, row in zip(dirty, new):
+            rows[i] = row
+
+        if 2 * len(dirty) > len(rows):
+            # Swapping most rows out costs more than starting over
+            self._recount()
+        else:
+            self.population += sum(map(int.bit_count, new)) - sum(map(int.bit_count, old))
+            self.hash ^= rows_hash(dirty, old, self.width) ^ rows_hash(dirty, new, self.width)
+            self._box_stale = True
+        return True
+
+    def replace(self, new_rows: list[int]) -> bool:
+        """Switch to the rows of a step that computed every row. Return whether any row changed."""
+        rows = self.rows
+        # Indices of the changed rows, no Python loops, busy boards change almost every row
+        dirty = list(compress(range(len(rows)), map(ne, rows, new_rows)))
+        if 2 * len(dirty) <= len(rows):
+            return self.update(dirty, list(map(new_rows.__getitem__, dirty)))
+
+        self.dirty = dirty
+        # Rows that didn't change add nothing
+        self.changed = sum(map(int.bit_count, map(xor, rows, new_rows)))
+        rows[:] = new_rows
+        self._recount()
+        return True
+
+    def _recount(self) -> None:
+        """Count the population and hash the board again from all rows."""
+        rows = self.rows
+        self.population = sum(map(int.bit_count, rows))
+        self.hash = rows_hash(range(len(rows)), rows, self.width)
+        self._box_stale = True
+
+    def candidates(self) -> list[int] | None:
+        """Return the rows that can change in the next step, the changed rows and their neighbours.
+
+        A row whose own and neighbouring rows didn't change stays the same.
+        Returns None if that's most of the board, stepping every row is faster then.
+        """
+        dirty, height = self.dirty, len(self.rows)
+        if 3 * len(dirty) > height:
+            return None
+        near = set(dirty)
+        near.update([i - 1 for i in dirty if i])
+        near.update([i + 1 for i in dirty if i + 1 < height])
+        return sorted(near)
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        """Return the first and last row and column with live cells, or None if there are none."""
+        if self._box_stale:
+            self._box = bounding_box(self.rows)
+            self._box_stale = False
+        return self._box
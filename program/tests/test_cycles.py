@@ -0,0 +1,42 @@
+"""Regression tests of the cycle detection with the fingerprints of every engine."""
+import os
+import sys
+import unittest
+
+# The modules live in the parent folder of the tests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engines import ENGINES, NUMPY_ERR  # pylint: disable=wrong-import-position
+from cycles import CycleDetector  # pylint: disable=wrong-import-position
+
+# Lightweight spaceship flying to the left, 2 columns every 4 generations
+LWSS: tuple = (".O..O", "O....", "O...O", "OOOO.")
+
+
+def spaceship_board(height: int = 9, width: int = 300) -> list[list[bool]]:
+    """Return a wide board with a lightweight spaceship at its right edge."""
+    board = [[False] * width for _ in range(height)]
+    for i, line in enumerate(LWSS):
+        for j, cell in enumerate(line):
+            board[3 + i][width - 20 + j] = cell == "O"
+    return board
+
+
+class SpaceshipCycleTest(unittest.TestCase):
+    """A spaceship never repeats a board until it crashes into the edge."""
+    def test_moving_spaceship_is_no_cycle(self):
+        for name, engine_class in ENGINES.items():
+            if name == "numpy" and NUMPY_ERR:
+                continue
+            with self.subTest(engine=name):
+                engine = engine_class(spaceship_board())
+                detector = CycleDetector()
+                # The spaceship reaches the left edge after about 560 generations
+                for generation in range(1, 500):
+                    engine.step()
+                    self.assertFalse(detector.check(engine.fingerprint(), generation),
+                                     detector.describe())
+                engine.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""Viewport onto boards that are bigger than the terminal.
+
+Only the visible window of the board is taken from the engine, so drawing
+a frame costs the same for a small board as for a huge one. Zooming out
+packs more cells into every character: 2 with half blocks, 8 with braille
+dots and even more when several cells share a braille dot.
+"""
+import threading
+
+from engines import Engine
+from history import Snapshot
+
+# Zoom levels from closest to farthest: (glyph, cells per dot in each direction)
+ZOOM_LEVELS: dict[str, tuple[str, int]] = {
+    "cells": ("cells", 1),
+    "half": ("half", 1),
+    "braille": ("braille", 1),
+    "braille2": ("braille", 2),
+    "braille4": ("braille", 4),
+    "braille8": ("braille", 8),
+}
+# Dots per character of every glyph (rows, columns), cells are 2 characters wide
+GLYPH_SIZE: dict[str, tuple[float, float]] = {
+    "cells": (1, 0.5),
+    "half": (2, 1),
+    "braille": (4, 2),
+}
+# Empty, upper, lower and full half block
+HALF_BLOCKS: str = " ▀▄█"
+# Bit of each braille dot, by row and column of the dot
+BRAILLE_DOTS: tuple = ((0x01, 0x08), (0x02, 0x10), (0x04, 0x20), (0x40, 0x80))
+
+
+def cells_on_screen(lines: int, columns: int, zoom: str) -> tuple[int, int]:
+    """Return how many rows and columns of cells fit into an area of the terminal at a zoom level."""
+    glyph, scale = ZOOM_LEVELS[zoom]
+    dot_rows, dot_columns = GLYPH_SIZE[glyph]
+    return int(lines * dot_rows) * scale, int(columns * dot_columns) * scale
+
+
+def downsample(window: list[list[bool]], scale: int) -> list[list[bool]]:
+    """Merge every scale x scale block of cells into one cell, alive if any of them is alive."""
+    merged_rows = [[any(column) for column in zip(*window[i:i + scale])]
+                   for i in range(0, len(window), scale)]
+    return [[any(row[j:j + scale]) for j in range(0, len(row), scale)] for row in merged_rows]
+
+
+def half_block_rows(window: list[list[bool]]) -> list[str]:
+    """Draw 2 rows of cells per line using half blocks."""
+    lines: list[str] = []
+    for i in range(0, len(window), 2):
+        upper = window[i]
+        lower = window[i + 1] if i + 1 < len(window) else [False] * len(upper)
+        lines.append("".join(HALF_BLOCKS[top + 2 * bottom] for top, bottom in zip(upper, lower)))
+    return lines
+
+
+def braille_rows(window: list[list[bool]]) -> list[str]:
+    """Draw 4 rows and 2 columns of cells per character using braille dots."""
+    lines: list[str] = []
+    for i in range(0, len(window), 4):
+        codes = [0] * ((len(window[0]) + 1) // 2)
+        for dots, row in zip(BRAILLE_DOTS, window[i:i + 4]):
+            for j, cell in enumerate(row):
+                if cell:
+                    codes[j >> 1] |= dots[j & 1]
+        lines.append("".join(chr(0x2800 + code) for code in codes))
+    return lines
+
+
+class Viewport:
+    """Visible window of a board, with its position and zoom level.
+
+    The viewport is moved and zoomed from the main thread while the
+    simulation worker captures frames, the version changes every time so
+    frames captured before a change can be recognised.
+    """
+    def __init__(self, board_height: int, board_width: int,
+                 lines: int, columns: int, zoom: str = "cells"):
+        self.board_height: int = board_height
+        self.board_width: int = board_width
+        # Size of the terminal area used for the board
+        self.lines: int = lines
+        self.columns: int = columns
+        self.level: int = list(ZOOM_LEVELS).index(zoom)
+        self.top: int = 0
+        self.left: int = 0
+        self.version: int = 0
+        self.lock = threading.Lock()
+
+    @property
+    def zoom(self) -> str:
+        """Name of the current zoom level."""
+        return list(ZOOM_LEVELS)[self.level]
+
+    def size(self) -> tuple[int, int]:
+        """Return the rows and columns of cells that are visible, at most the whole board."""
+        height, width = cells_on_screen(self.lines, self.columns, self.zoom)
+        return min(height, self.board_height), min(width, self.board_width)
+
+    def describe(self) -> str:
+        """Return the zoom level and the visible part of the board, for the status line.
+
+        Empty if the whole board is visible at the closest zoom level.
+        """
+        height, width = self.size()
+        if self.level == 0 and (height, width) == (self.board_height, self.board_width):
+            return ""
+        return (f"Zoom: {self.zoom}, rows {self.top + 1}-{self.top + height} of {self.board_height}, "
+                f"columns {self.left + 1}-{self.left + width} of {self.board_width}")
+
+    def _clamp(self) -> None:
+        """Keep the window within the board."""
+        height, width = self.size()
+        self.top = max(0, min(self.top, self.board_height - height))
+        self.left = max(0, min(self.left, self.board_width - width))
+
+    def pan(self, rows: float, columns: float) -> None:
+        """Move the window by a fraction of its size, e.g. pan(0.5, 0) for half a screen down."""
+        with self.lock:
+            height, width = self.size()
+            self.top += int(rows * height)
+            self.left += int(columns * width)
+            self._clamp()
+            self.version += 1
+
+    def dirty_lines(self, rows: list[int], version: int) -> set[int] | None:
+        """Return the screen lines that show any of the board rows, e.g. the rows that changed.
+
+        Returns None if the viewport changed since the capture with the version.
+        """
+        with self.lock:
+            if version != self.version:
+                return None
+            top = self.top
+            glyph, scale = ZOOM_LEVELS[self.zoom]
+            height, _ = self.size()
+        # Board rows drawn on every line
+        per_line = int(GLYPH_SIZE[glyph][0]) * scale
+        return {(row - top) // per_line for row in rows if top <= row < top + height}
+
+    def zoom_by(self, steps: int) -> None:
+        """Zoom out (positive steps) or in (negative steps), keeping the centre in place."""
+        with self.lock:
+            height, width = self.size()
+            centre = (self.top + height // 2, self.left + width // 2)
+            self.level = max(0, min(self.level + steps, len(ZOOM_LEVELS) - 1))
+            height, width = self.size()
+            self.top, self.left = centre[0] - height // 2, centre[1] - width // 2
+            self._clamp()
+            self.version += 1
+
+    def capture(self, engine: Engine | Snapshot) -> tuple[int, list[list[bool]] | list[str]]:
+        """Return the version of the viewport and the visible part of the board of an engine.
+
+        Past generations from the history can be captured as well.
+
+        At the "cells" zoom level, the part is returned as cells for the
+        renderer, otherwise as lines of half block or braille characters.
+        """
+        with self.lock:
+            version, top, left = self.version, self.top, self.left
+            glyph, scale = ZOOM_LEVELS[self.zoom]
+            height, width = self.size()
+
+        window = engine.window(top, left, height, width)
+        if glyph == "cells":
+            return version, window
+        if scale > 1:
+            window = downsample(window, scale)
+        return version, half_block_rows(window) if glyph == "half" else braille_rows(window)